@@ -7,10 +7,11 @@ client instance.
 """
 
 import os
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 import logging
 import threading
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Ensure .env is loaded
@@ -18,6 +19,62 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Service types that get a dedicated client instance
+SERVICE_TYPES = ("text_analysis", "facial_analysis", "conversation", "transcription", "evaluation_summary")
+
+def _build_http_client() -> httpx.AsyncClient:
+    """
+    Build the HTTP transport used by the AsyncOpenAI clients.
+
+    HTTP/2 lets concurrent completions multiplex over a single TLS connection
+    instead of opening one HTTP/1.1 connection (and handshake) per in-flight request.
+    The pool is sized for concurrent batch analyses, idle connections are kept warm
+    between interview turns, and a 60s timeout replaces the SDK's 10-minute default
+    so a stalled completion fails over to the retry response.
+    """
+    return DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+def create_async_client(base_url: Optional[str], api_key: Optional[str]) -> AsyncOpenAI:
+    """Create an AsyncOpenAI client backed by the shared HTTP/2 transport settings."""
+    return AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        http_client=_build_http_client()
+    )
+
+# Clients shared by callers that bring their own credentials, keyed by (base_url, api_key)
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str]], AsyncOpenAI] = {}
+_client_cache_lock = threading.Lock()
+
+def get_async_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Get a cached AsyncOpenAI client for the given endpoint and credentials.
+    
+    Reusing one client per (base_url, api_key) keeps a single connection pool
+    alive instead of paying TCP/TLS setup for a fresh client on every request.
+    
+    Args:
+        base_url (Optional[str]): API base URL, or None for the SDK default
+        api_key (Optional[str]): API key for the endpoint
+        
+    Returns:
+        AsyncOpenAI: The shared client instance
+    """
+    key = (base_url, api_key)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _client_cache_lock:
+            # Double-check locking pattern
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = create_async_client(base_url, api_key)
+                _CLIENT_CACHE[key] = client
+    return client
+
 class AIClientManager:
     """
     Manages dedicated AI client instances for different services.
@@ -72,26 +129,8 @@ class AIClientManager:
             # Create dedicated clients for different services
             try:
                 self._clients = {
-                    "text_analysis": AsyncOpenAI(
-                        base_url=base_url,
-                        api_key=api_key
-                    ),
-                    "facial_analysis": AsyncOpenAI(
-                        base_url=base_url,
-                        api_key=api_key
-                    ),
-                    "conversation": AsyncOpenAI(
-                        base_url=base_url,
-                        api_key=api_key
-                    ),
-                    "transcription": AsyncOpenAI(
-                        base_url=base_url,
-                        api_key=api_key
-                    ),
-                    "evaluation_summary": AsyncOpenAI(
-                        base_url=base_url,
-                        api_key=api_key
-                    )
+                    service_type: create_async_client(base_url, api_key)
+                    for service_type in SERVICE_TYPES
                 }
                 
                 self._initialized = True
@@ -128,6 +167,14 @@ class AIClientManager:
         
         return self._clients[service_type]
     
+    async def close(self):
+        """Close every dedicated client and release its connection pool."""
+        clients = list(self._clients.values())
+        self._clients = {}
+        self._initialized = False
+        for client in clients:
+            await client.close()
+    
     def get_text_analysis_client(self) -> AsyncOpenAI:
         """Get dedicated client for text analysis services."""
         return self.get_client("text_analysis")
@@ -169,6 +216,18 @@ def get_ai_client_manager() -> AIClientManager:
     
     return _ai_manager
 
+async def close_ai_clients():
+    """Close all managed and cached AI clients. Called on application shutdown."""
+    if _ai_manager is not None:
+        await _ai_manager.close()
+    
+    cached_clients = list(_CLIENT_CACHE.values())
+    _CLIENT_CACHE.clear()
+    for client in cached_clients:
+        await client.close()
+    
+    logger.info("Closed all AI client instances")
+
 # Convenience accessors for backward compatibility
 def get_text_analysis_client() -> AsyncOpenAI:
     """Get dedicated client for text analysis services."""
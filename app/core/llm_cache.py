@@ -0,0 +1,106 @@
+"""
+LLM Response Cache Module
+
+This module provides an in-process cache for LLM responses so identical analysis
+requests (retries, repeated textbook answers, development reruns) can be served
+without another round-trip to the model.
+
+The module contains:
+- LLMCache: An async LRU cache with per-entry TTL
+- llm_response_cache: Shared instance used by the analysis services
+
+Dependencies:
+- collections: For the ordered LRU storage
+- hashlib: For hashing request fields into cache keys
+- json: For canonical serialization of the key fields
+- time: For entry expiry
+
+Author: @kcaparas1630
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import hashlib
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class LLMCache:
+    """
+    Async LRU cache with per-entry TTL for serialized LLM responses.
+
+    Values are stored as strings (e.g. a model's JSON dump) so cached objects
+    can never be mutated by callers. The async interface keeps call sites
+    unchanged if the storage is later moved to an external store.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept before evicting the least recently used.
+        default_ttl (float): Time-to-live in seconds for entries stored without an explicit TTL.
+    """
+
+    def __init__(self, max_size: int = 1024, default_ttl: float = 3600.0):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(**fields) -> str:
+        """
+        Build a stable cache key from request fields.
+
+        Args:
+            **fields: The fields that determine the response (model, prompt inputs, ...)
+
+        Returns:
+            str: SHA-256 hex digest of the canonical JSON encoding of the fields
+        """
+        payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): The cache key
+
+        Returns:
+            Optional[str]: The cached value, or None on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key (str): The cache key
+            value (str): The serialized value to cache
+            ttl (Optional[float]): Time-to-live in seconds (defaults to default_ttl)
+        """
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+
+# Global instance for reuse across the application
+llm_response_cache = LLMCache()
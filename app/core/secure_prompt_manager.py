@@ -13,30 +13,41 @@ The module contains:
 Dependencies:
 - dataclasses: For template data structures
 - typing: For type hints
-- re: For regex-based sanitization
 - html: For HTML entity encoding
+- functools: For memoizing sanitization of short repeated fields
 
 Author: @kcaparas1630
 """
 
-from typing import Dict
-from dataclasses import dataclass
-import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass, field
+import functools
 import html
 import logging
+import sys
 from app.schemas.session_evaluation_schemas import InterviewFeedbackResponse, FacialAnalysisResult
 
 logger = logging.getLogger(__name__)
 
+# Deletion table for null bytes and other control characters (except tab, newline and
+# carriage return), zero-width characters and bidi controls, which can hide or reorder
+# injected text; str.translate strips them all in a single pass
+_DELETED_CHARS_TABLE = dict.fromkeys([
+    *range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F,   # C0 controls and DEL
+    0x200B, 0x200C, 0x200D, 0x2060, 0xFEFF,                     # Zero-width characters
+    0x200E, 0x200F, *range(0x202A, 0x202F), *range(0x2066, 0x206A)  # Bidi marks, embeddings, overrides, isolates
+])
+
 def sanitize_text(text: str, max_length: int = 1000, escape_html: bool = True) -> str:
     """
     Sanitize text input to prevent injection attacks and ensure data safety.
     
     This function performs multiple sanitization steps:
-    1. Optional HTML entity encoding to prevent XSS
-    2. Strips leading/trailing whitespace
-    3. Removes null bytes and other control characters
-    4. Configurable length limiting to prevent DoS attacks
+    1. Configurable length limiting to prevent DoS attacks, applied first so
+       the remaining steps never scan more than max_length characters
+    2. Optional HTML entity encoding to prevent XSS
+    3. Removes null bytes, other control characters, zero-width characters and bidi controls
+    4. Strips leading/trailing whitespace, including any that was wrapped in removed characters
     5. Normalizes unicode characters
     
     Args:
@@ -56,20 +67,31 @@ def sanitize_text(text: str, max_length: int = 1000, escape_html: bool = True) -
     # Convert to string if not already
     text = str(text)
     
+    # Short fields such as job role and level repeat on every render; long unique
+    # payloads (answers, landmarks data) would only churn the cache
+    if len(text) <= _SANITIZE_CACHE_MAX_TEXT_LENGTH:
+        return _sanitize_text_cached(text, max_length, escape_html)
+    return _sanitize_text(text, max_length, escape_html)
+
+def _sanitize_text(text: str, max_length: int, escape_html: bool) -> str:
+    """Run the sanitization steps of sanitize_text on a non-None string."""
+    # Configurable length limiting to prevent DoS attacks
+    if len(text) > max_length:
+        text = text[:max_length]
+        logger.warning(f"Text truncated to {max_length} characters for security")
+    
     # Optional HTML entity encoding to prevent XSS
     if escape_html:
         text = html.escape(text)
     
-    # Strip leading/trailing whitespace
-    text = text.strip()
+    # Remove control characters (except newlines and tabs), zero-width characters and bidi controls
+    text = text.translate(_DELETED_CHARS_TABLE)
     
-    # Remove null bytes and other control characters (except newlines and tabs)
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    # Strip leading/trailing whitespace after removal so none is left exposed by it
+    text = text.strip()
     
-    # Configurable length limiting to prevent DoS attacks
-    if len(text) > max_length:
-        text = text[:max_length]
-        logger.warning(f"Text truncated to {max_length} characters for security")
+    # Entity encoding can lengthen the text, so enforce the limit on the result too
+    text = text[:max_length]
     
     # Normalize unicode characters
     text = text.encode('utf-8', errors='ignore').decode('utf-8')
@@ -80,12 +102,27 @@ def sanitize_text(text: str, max_length: int = 1000, escape_html: bool = True) -
     
     return text
 
+# Memoized sanitization for short inputs; exceptions (empty text) are not cached
+_SANITIZE_CACHE_MAX_TEXT_LENGTH = 256
+_sanitize_text_cached = functools.lru_cache(maxsize=2048)(_sanitize_text)
+
 @dataclass
 class PromptTemplate:
     """Secure prompt template with placeholders for safe data injection."""
     template: str
     placeholders: Dict[str, str]
     sanitization_config: Dict[str, Dict] = None  # Per-placeholder sanitization config
+    # Derived once at construction so rendering is only lookups and one format_map
+    _required: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _sanitize_options: Dict[str, Tuple[int, bool]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._required = frozenset(self.placeholders)
+        config = self.sanitization_config or {}
+        self._sanitize_options = {
+            key: (config.get(key, {}).get('max_length', 1000), config.get(key, {}).get('escape_html', True))
+            for key in self._required
+        }
     
     def render(self, **kwargs) -> str:
         """
@@ -101,50 +138,30 @@ class PromptTemplate:
             ValueError: If required placeholders are missing or data is invalid
         """
         # Validate all required placeholders are provided
-        missing_placeholders = set(self.placeholders.keys()) - set(kwargs.keys())
+        missing_placeholders = self._required - kwargs.keys()
         if missing_placeholders:
-            raise ValueError(f"Missing required placeholders: {missing_placeholders}")
+            raise ValueError(f"Missing required placeholders: {set(missing_placeholders)}")
+        
+        # Skip unknown keys to prevent injection
+        for key in kwargs.keys() - self._required:
+            logger.warning(f"Unknown placeholder key: {key}")
         
-        # Sanitize all input data with configurable options
-        sanitized_data = {}
-        for key, value in kwargs.items():
-            if key in self.placeholders:
-                # Get sanitization config for this placeholder
-                config = self.sanitization_config.get(key, {}) if self.sanitization_config else {}
-                max_length = config.get('max_length', 1000)
-                escape_html = config.get('escape_html', True)
-                
-                sanitized_data[key] = sanitize_text(str(value), max_length=max_length, escape_html=escape_html)
-            else:
-                # Skip unknown keys to prevent injection
-                logger.warning(f"Unknown placeholder key: {key}")
-                continue
+        # Sanitize only the declared placeholders with their configured options
+        sanitized_data = {
+            key: sanitize_text(str(kwargs[key]), max_length=max_length, escape_html=escape_html)
+            for key, (max_length, escape_html) in self._sanitize_options.items()
+        }
         
         # Use safe string formatting with explicit placeholders
         try:
-            return self.template.format(**sanitized_data)
+            return self.template.format_map(sanitized_data)
         except KeyError as e:
             raise ValueError(f"Template rendering error: {e}") from e
 
-class SecurePromptManager:
-    """
-    Secure prompt manager that isolates prompts from user data to prevent injection attacks.
-    
-    This class provides a secure way to manage AI prompts by:
-    1. Using predefined templates with explicit placeholders
-    2. Sanitizing all user data before injection
-    3. Validating data types and content
-    4. Preventing arbitrary code execution through prompt injection
-    """
-    
-    def __init__(self):
-        self._templates = self._initialize_templates()
-    
-    def _initialize_templates(self) -> Dict[str, PromptTemplate]:
-        """Initialize secure prompt templates with explicit placeholders."""
-        return {
-            "response_analysis": PromptTemplate(
-                template="""# Refined MockMentor Prompt - Score Only
+# Static instructions for response analysis. Kept free of per-request data so the
+# system message is byte-identical across requests and backends with prefix
+# caching can reuse its prefill instead of recomputing it for every call.
+RESPONSE_ANALYSIS_SYSTEM_PROMPT = sys.intern("""# Refined MockMentor Prompt - Score Only
 
 <core_identity>
 You are MockMentor, an expert HR professional and interview coach. Analyze interview responses and provide constructive feedback that is specific, balanced, and actionable.
@@ -152,18 +169,18 @@ You are MockMentor, an expert HR professional and interview coach. Analyze inter
 
 <output_format>
 Return ONLY valid JSON with this exact structure - NO thought process, explanations, or additional text:
-{{
+{
   "score": 7,
   "feedback": "Brief summary (2-3 sentences)",
   "strengths": ["Strength 1", "Strength 2", "Strength 3"],
   "tips": ["Tip 1", "Tip 2", "Tip 3"],
   "technical_issue_detected": false,
   "needs_retry": false,
-  "next_action": {{
+  "next_action": {
     "type": "continue" | "retry_question",
     "message": "Your message to the user for the next turn"
-  }}
-}}
+  }
+}
 
 </output_format>
 
@@ -197,9 +214,91 @@ Set "technical_issue_detected": true and "needs_retry": true when detecting:
 
 <efficiency_rules>
 - Limit to ONE retry per question maximum
-</efficiency_rules>
+</efficiency_rules>""")
+
+# Static parts of the emotion analysis prompt surrounding the per-request context,
+# so only the short context is formatted on each call
+_EMOTION_PROMPT_HEAD = sys.intern("""You are MockMentor, an AI interview coach that analyzes facial emotion data to provide helpful feedback. You MUST return ONLY valid JSON.
+
+ANALYSIS CONTEXT:
+""")
+
+_EMOTION_PROMPT_TAIL = sys.intern("""
 
-Context: Job Role: {job_role}, Job Level: {job_level}, Interview Type: {interview_type}, Question Type: {question_type}
+YOUR ROLE:
+- Analyze the provided emotion metrics to understand the candidate's state
+- Provide specific, actionable feedback based on the data
+- Focus on interview performance improvement
+- Be encouraging yet constructive
+- Keep feedback concise and professional
+
+ANALYSIS GUIDELINES:
+
+CONFIDENT INDICATORS:
+- Moderate smile (40-70) + low tension (0-30) + good symmetry (70+) = confident demeanor
+- Feedback: "Your steady expression projects confidence and professionalism"
+
+NERVOUS INDICATORS:  
+- High tension (60+) + low symmetry (0-50) + variable features = nervous energy
+- Feedback: "I notice some tension in your expression. Take a deep breath and relax your facial muscles"
+
+HAPPY/ENGAGED INDICATORS:
+- High smile (60+) + good eye openness (60+) + low tension = positive engagement  
+- Feedback: "Your positive expression and natural smile create great rapport"
+
+SURPRISED/ALERT INDICATORS:
+- High eyebrow raise (50+) + wide eyes (70+) = high alertness
+- Feedback: "You look very alert and engaged - excellent for staying attentive"
+
+FOCUSED INDICATORS:
+- Good eye openness (50-80) + low tension + balanced features = professional focus
+- Feedback: "Your concentrated expression shows excellent attention and focus"
+
+NEUTRAL/COMPOSED INDICATORS:
+- Balanced features across the board = professional composure
+- Feedback: "You have a calm, professional expression that's well-suited for interviews"
+
+IMPORTANT RULES:
+- Always provide specific observations based on the actual metrics
+- Mention trends if significant changes are noted
+- Address data quality issues if confidence is low (<50)
+- Keep feedback to 1-2 sentences maximum
+- Be encouraging while providing actionable advice
+- Never mention technical details about the analysis process
+
+RESPONSE FORMAT (RETURN ONLY THIS JSON):
+{
+  "feedback": "Specific observation and advice based on emotion analysis"
+}
+
+Analyze the emotion data and provide appropriate feedback that helps improve interview performance.""")
+
+class SecurePromptManager:
+    """
+    Secure prompt manager that isolates prompts from user data to prevent injection attacks.
+    
+    This class provides a secure way to manage AI prompts by:
+    1. Using predefined templates with explicit placeholders
+    2. Sanitizing all user data before injection
+    3. Validating data types and content
+    4. Preventing arbitrary code execution through prompt injection
+    
+    Templates are never modified after construction, so they are built once and
+    shared by every instance through a class attribute.
+    """
+    
+    _templates: Optional[Dict[str, PromptTemplate]] = None
+    
+    def __init__(self):
+        if SecurePromptManager._templates is None:
+            SecurePromptManager._templates = self._initialize_templates()
+    
+    @staticmethod
+    def _initialize_templates() -> Dict[str, PromptTemplate]:
+        """Initialize secure prompt templates with explicit placeholders."""
+        return {
+            "response_analysis_context": PromptTemplate(
+                template="""Context: Job Role: {job_role}, Job Level: {job_level}, Interview Type: {interview_type}, Question Type: {question_type}
 Question: {question}
 Answer: {answer}""",
                 placeholders={
@@ -358,6 +457,19 @@ Keep it warm but concise. Maximum 6 sentences total, ensuring facial insight is
             )
         }
     
+    def _render_response_analysis_context(self, analysis_request) -> str:
+        """Render the per-request context block for response analysis."""
+        template = self._templates["response_analysis_context"]
+        
+        return template.render(
+            job_role=analysis_request.jobRole,
+            job_level=analysis_request.jobLevel,
+            interview_type=analysis_request.interviewType,
+            question_type=analysis_request.questionType,
+            question=analysis_request.question,
+            answer=analysis_request.answer
+        )
+    
     def get_response_analysis_prompt(self, analysis_request) -> str:
         """
         Get a secure response analysis prompt with sanitized user data.
@@ -371,16 +483,29 @@ Keep it warm but concise. Maximum 6 sentences total, ensuring facial insight is
         Raises:
             ValueError: If data validation fails
         """
-        template = self._templates["response_analysis"]
+        context = self._render_response_analysis_context(analysis_request)
+        return f"{RESPONSE_ANALYSIS_SYSTEM_PROMPT}\n\n{context}"
+    
+    def get_response_analysis_messages(self, analysis_request) -> List[Dict[str, str]]:
+        """
+        Get the response analysis prompt as system messages with a shared static prefix.
         
-        return template.render(
-            job_role=analysis_request.session_metadata.jobRole,
-            job_level=analysis_request.session_metadata.jobLevel,
-            interview_type=analysis_request.interviewType,
-            question_type=analysis_request.session_metadata.questionType,
-            question=analysis_request.question,
-            answer=analysis_request.answer
-        )
+        The first message holds only the static instructions and is identical for
+        every request; the second carries the sanitized per-request context.
+        
+        Args:
+            analysis_request: The validated analysis request
+            
+        Returns:
+            List[Dict[str, str]]: The static and context system messages
+            
+        Raises:
+            ValueError: If data validation fails
+        """
+        return [
+            {"role": "system", "content": RESPONSE_ANALYSIS_SYSTEM_PROMPT},
+            {"role": "system", "content": self._render_response_analysis_context(analysis_request)}
+        ]
     
     def get_system_prompt(self, interview_session) -> str:
         """
@@ -415,61 +540,7 @@ Keep it warm but concise. Maximum 6 sentences total, ensuring facial insight is
         Returns:
             str: The secure prompt for LLM emotion analysis
         """
-        
-        prompt = f"""You are MockMentor, an AI interview coach that analyzes facial emotion data to provide helpful feedback. You MUST return ONLY valid JSON.
-
-ANALYSIS CONTEXT:
-{emotion_context}
-
-YOUR ROLE:
-- Analyze the provided emotion metrics to understand the candidate's state
-- Provide specific, actionable feedback based on the data
-- Focus on interview performance improvement
-- Be encouraging yet constructive
-- Keep feedback concise and professional
-
-ANALYSIS GUIDELINES:
-
-CONFIDENT INDICATORS:
-- Moderate smile (40-70) + low tension (0-30) + good symmetry (70+) = confident demeanor
-- Feedback: "Your steady expression projects confidence and professionalism"
-
-NERVOUS INDICATORS:  
-- High tension (60+) + low symmetry (0-50) + variable features = nervous energy
-- Feedback: "I notice some tension in your expression. Take a deep breath and relax your facial muscles"
-
-HAPPY/ENGAGED INDICATORS:
-- High smile (60+) + good eye openness (60+) + low tension = positive engagement  
-- Feedback: "Your positive expression and natural smile create great rapport"
-
-SURPRISED/ALERT INDICATORS:
-- High eyebrow raise (50+) + wide eyes (70+) = high alertness
-- Feedback: "You look very alert and engaged - excellent for staying attentive"
-
-FOCUSED INDICATORS:
-- Good eye openness (50-80) + low tension + balanced features = professional focus
-- Feedback: "Your concentrated expression shows excellent attention and focus"
-
-NEUTRAL/COMPOSED INDICATORS:
-- Balanced features across the board = professional composure
-- Feedback: "You have a calm, professional expression that's well-suited for interviews"
-
-IMPORTANT RULES:
-- Always provide specific observations based on the actual metrics
-- Mention trends if significant changes are noted
-- Address data quality issues if confidence is low (<50)
-- Keep feedback to 1-2 sentences maximum
-- Be encouraging while providing actionable advice
-- Never mention technical details about the analysis process
-
-RESPONSE FORMAT (RETURN ONLY THIS JSON):
-{{
-  "feedback": "Specific observation and advice based on emotion analysis"
-}}
-
-Analyze the emotion data and provide appropriate feedback that helps improve interview performance."""
-
-        return prompt
+        return f"{_EMOTION_PROMPT_HEAD}{emotion_context}{_EMOTION_PROMPT_TAIL}"
     def get_summarization_prompt(self, text_analysis: InterviewFeedbackResponse, facial_analysis: FacialAnalysisResult) -> str:
         """
         Get a secure summarization prompt with sanitized data.
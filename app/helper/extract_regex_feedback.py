@@ -28,7 +28,7 @@ from loguru import logger
 # Extract feedback from the content using regex patterns
 def extract_regex_feedback(content: str, request: InterviewAnalysisRequest):
     # Log that we're in the regex fallback mode
-    logger.warning(f"[REGEX_FALLBACK] Attempting regex extraction for malformed JSON. Content: {content}")
+    logger.warning("[REGEX_FALLBACK] Attempting regex extraction for malformed JSON. Content: {}", content)
     
     try:
         # Parse the entire content as a JSON object
@@ -56,8 +56,8 @@ def extract_regex_feedback(content: str, request: InterviewAnalysisRequest):
 
     except json.JSONDecodeError as e:
         # Fallback: extract only simple fields using regex, always provide default next_action
-        logger.error(f"[REGEX_FALLBACK] JSON parsing failed in regex extraction: {e}")
-        logger.error(f"[REGEX_FALLBACK] Falling back to regex pattern matching")
+        logger.error("[REGEX_FALLBACK] JSON parsing failed in regex extraction: {}", e)
+        logger.error("[REGEX_FALLBACK] Falling back to regex pattern matching")
         def extract_list(pattern, text):
             match = REGEX_PATTERNS[pattern].search(text)
             if match:
@@ -100,7 +100,7 @@ def extract_regex_feedback(content: str, request: InterviewAnalysisRequest):
             )
         )
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: {}", e)
         return InterviewFeedbackResponse(
             score=5,
             feedback="An unexpected error occurred.",
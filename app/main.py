@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+import asyncio
 import os
 from fastapi import FastAPI
 from fastapi.security import HTTPBearer
@@ -18,6 +19,12 @@ from app.core.cors_middleware import add_cors_middleware
 from loguru import logger
 # Database
 from app.database import create_tables
+# AI clients
+from app.core.ai_client_manager import close_ai_clients
+# Question indexes
+from app.services.main_conversation.tools.question_utils.get_questions import ensure_question_indexes
+# Transcription model
+from app.services.transcription.transcriber import warm_up_transcriber
 # Error Handling
 from fastapi.exceptions import RequestValidationError
 from fastapi import HTTPException, Request
@@ -39,6 +46,10 @@ async def lifespan(app: FastAPI):
     # Startup
     try:
         create_tables()
+        # Off the event loop: index creation is a blocking MongoDB round trip, and
+        # loading and warming the model takes a few seconds
+        await asyncio.to_thread(ensure_question_indexes)
+        await asyncio.to_thread(warm_up_transcriber)
         logger.info("Application startup completed successfully")
 
         
@@ -48,7 +59,8 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Shutdown (if needed)
+    # Shutdown
+    await close_ai_clients()
     logger.info("Application shutdown")
 
 # Initialize FastAPI app
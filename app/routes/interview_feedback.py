@@ -21,11 +21,11 @@ Author: @kcaparas1630
 
 """
 import os
-from openai import AsyncOpenAI
 from fastapi import APIRouter
 from app.schemas.session_evaluation_schemas.interview_analysis_request import InterviewAnalysisRequest
 from app.schemas.session_evaluation_schemas.session_state import InterviewFeedbackResponse
 from app.services.speech_to_text.text_answers_service import TextAnswersService
+from app.core.ai_client_manager import get_async_client
 from loguru import logger
 from app.errors.exceptions import InternalServerError
 
@@ -42,7 +42,7 @@ async def get_interview_feedback(request: InterviewAnalysisRequest):
     Get interview feedback for a given question and user response
     """
     try:
-        client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_async_client(api_key=os.getenv("OPENAI_API_KEY"))
         service = TextAnswersService(client)
         feedback = await service.analyze_response(request)
         
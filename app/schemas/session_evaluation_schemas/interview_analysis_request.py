@@ -9,10 +9,35 @@ Dependencies:
 
 Author: @kcaparas1630
 """
-from pydantic import Field
+from typing import Optional
+from pydantic import Field, model_validator
 from app.schemas.session_evaluation_schemas.interview_request import InterviewRequest
 from app.schemas.session_evaluation_schemas.session_state import SessionMetadata
 
 class InterviewAnalysisRequest(InterviewRequest):
-    session_metadata: SessionMetadata
+    """
+    Interview analysis request.
+    
+    The interview context can be given either as session_metadata or as flat
+    jobRole/jobLevel/questionType fields. Validation copies session_metadata into
+    the flat fields, so consumers always read the flat fields.
+    """
+    session_metadata: Optional[SessionMetadata] = None
+    jobRole: Optional[str] = None
+    jobLevel: Optional[str] = None
+    questionType: Optional[str] = None
     interviewType: str = Field(default="Behavioral")
+
+    @model_validator(mode="after")
+    def normalize_metadata(self) -> "InterviewAnalysisRequest":
+        """Populate the flat context fields from session_metadata and require them."""
+        if self.session_metadata is not None:
+            if self.jobRole is None:
+                self.jobRole = self.session_metadata.jobRole
+            if self.jobLevel is None:
+                self.jobLevel = self.session_metadata.jobLevel
+            if self.questionType is None:
+                self.questionType = self.session_metadata.questionType
+        if self.jobRole is None or self.jobLevel is None or self.questionType is None:
+            raise ValueError("jobRole, jobLevel and questionType are required, either directly or via session_metadata")
+        return self
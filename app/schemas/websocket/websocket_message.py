@@ -13,7 +13,7 @@ Author: @kcaparas1630
 """
 
 from pydantic import BaseModel
-from typing import Literal, Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any, Union
 
 # Base model for all websocket messages
 class WebSocketMessage(BaseModel):
@@ -23,6 +23,6 @@ class WebSocketMessage(BaseModel):
     next_question: Optional[Dict[str, Any]] = None
     timestamp: Optional[str] = None
 
-# Model for user messages
+# Model for user messages; structured content is sent as an object rather than a JSON-encoded string
 class WebSocketUserMessage(BaseModel):
-    content: str
+    content: Union[str, Dict[str, Any]]
@@ -239,12 +239,7 @@ CONTEXT NOTES:
                     },
                     {
                         "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"Analyze this emotion data and provide specific, actionable feedback:\n\n{emotion_context}"
-                            }
-                        ]
+                        "content": f"Analyze this emotion data and provide specific, actionable feedback:\n\n{emotion_context}"
                     }
                 ]
             )
@@ -23,15 +23,11 @@ Dependencies:
 - app.schemas.main.interview_session: For defining the interview session schema.
 - app.schemas.main.user_message: For defining user message schema.
 - app.schemas.websocket.websocket_user_message: For defining WebSocket user message schema.
-- app.schemas.main.interview_session: For defining the interview session schema.
-- app.schemas.main.user_message: For defining user message schema.
 - app.errors.exceptions: For handling exceptions.
 
 Author: @kcaparas1630
 """
 
-import os
-from openai import AsyncOpenAI
 from app.core.ai_client_manager import get_conversation_client, get_text_analysis_client
 from loguru import logger
 from app.schemas.main.interview_session import InterviewSession
@@ -50,8 +46,6 @@ from app.services.main_conversation.tools.response_analysis import (
     handle_next_action
 )
 from app.services.main_conversation.tools.response_analysis.action_handlers import reset_question_attempts
-from app.services.main_conversation.tools.question_utils.advance_to_next_question import advance_to_next_question
-from app.services.main_conversation.tools.question_utils.get_current_question import get_current_question
 from app.errors.exceptions import BadRequest, NotFound, InternalServerError
 
 
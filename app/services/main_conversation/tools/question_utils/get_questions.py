@@ -14,16 +14,25 @@ Returns:
     - count: The number of questions found.
     - criteria: A dictionary containing the job role, job level, and question type used for the query.
 
+Results are cached in-process for QUESTIONS_CACHE_TTL seconds per (jobRole, jobLevel,
+questionType), since question sets change rarely and sessions for the same role reuse them.
+
 Dependencies:
 - pymongo: For MongoDB interactions.
+- asyncio: For running the blocking query off the event loop.
 - os: For environment variable access.
 - dotenv: For loading environment variables from a .env file.
 - loguru: For logging.
 
 author: @kcaparas1630
 """
-from pymongo import MongoClient
+from pymongo import MongoClient, timeout as pymongo_timeout
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
 import os
+import time
 from dotenv import load_dotenv
 from loguru import logger
 load_dotenv()
@@ -32,6 +41,77 @@ client = MongoClient(os.getenv("MONGODB_URI"))
 db = client.MockMentor
 questions_collection = db.Question
 
+# Compound index matching the get_questions filter; question and _id are included
+# so the projected fields are read from the index without fetching documents
+QUESTION_INDEX_KEYS = [("jobRole", 1), ("jobLevel", 1), ("questionType", 1), ("question", 1), ("_id", 1)]
+QUESTION_INDEX_NAME = "jobrole_level_type_question"
+# Bounds server selection too, so an unreachable database can't stall startup for 30s
+QUESTION_INDEX_TIMEOUT = 5.0
+
+def ensure_question_indexes():
+    """
+    Create the index backing get_questions if it does not exist yet.
+    
+    Called once at application startup rather than at import so importing this
+    module does not require a reachable database. Blocking, so callers on the event
+    loop should run it in a thread. Failures are logged, not raised, since queries
+    still work (more slowly) without the index.
+    """
+    try:
+        with pymongo_timeout(QUESTION_INDEX_TIMEOUT):
+            questions_collection.create_index(QUESTION_INDEX_KEYS, name=QUESTION_INDEX_NAME)
+        logger.info(f"Ensured MongoDB index {QUESTION_INDEX_NAME} on Question collection")
+    except Exception as e:
+        logger.warning(f"Could not create MongoDB index {QUESTION_INDEX_NAME}: {e}")
+
+# In-process LRU cache of question data keyed by the query criteria
+QUESTIONS_CACHE_TTL = 300.0
+QUESTIONS_CACHE_MAX_SIZE = 128
+_questions_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+# One [lock, users] entry per criteria so concurrent misses for the same key share a
+# single query; an entry is dropped once nothing holds or waits on it
+_questions_locks: Dict[Tuple[str, str, str], List[Any]] = {}
+
+def clear_questions_cache():
+    """Drop all cached question results."""
+    _questions_cache.clear()
+    _questions_locks.clear()
+
+def _get_cached_questions(cache_key: Tuple[str, str, str]) -> Optional[List[Dict[str, str]]]:
+    """Return the cached question data for the criteria, or None if missing or expired."""
+    cached = _questions_cache.get(cache_key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    _questions_cache.move_to_end(cache_key)
+    return cached[1]
+
+@asynccontextmanager
+async def _questions_lock(cache_key: Tuple[str, str, str]) -> AsyncIterator[None]:
+    """Hold the lock for the criteria, removing it when the last user releases it."""
+    entry = _questions_locks.get(cache_key)
+    if entry is None:
+        entry = _questions_locks[cache_key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0 and _questions_locks.get(cache_key) is entry:
+            del _questions_locks[cache_key]
+
+def _find_question_data(query: dict) -> List[Dict[str, str]]:
+    """Run the blocking MongoDB query and return question texts with their IDs."""
+    return [
+        {
+            "id": str(doc["_id"]),
+            "text": doc["question"]
+        } for doc in questions_collection.find(
+            query,
+            {"question": 1, "_id": 1}  # Return both question text and ID
+        )
+    ]
+
 async def get_questions(jobRole: str, jobLevel: str, questionType: str):
     """
         Fetch interview questions from database based on job criteria.
@@ -49,30 +129,35 @@ async def get_questions(jobRole: str, jobLevel: str, questionType: str):
         # Convert interviewType to questionType for database query
         questionType = questionType.lower()
         
-        # Log the exact query we're making
-        query = {
-            "jobRole": jobRole,
-            "jobLevel": jobLevel,
-            "questionType": questionType
-        }
-        logger.info(f"Querying MongoDB with: {query}")
-        
-        # Find questions based on criteria and return both question text and ID
-        questions = list(questions_collection.find(
-            query,
-            {"question": 1, "_id": 1}  # Return both question text and ID
-        ))
-        
-        # Log the raw results for debugging
-        logger.info(f"Raw MongoDB results: {questions}")
+        cache_key = (jobRole, jobLevel, questionType)
+        question_data = _get_cached_questions(cache_key)
+        if question_data is None:
+            async with _questions_lock(cache_key):
+                # Another session may have filled the cache while we waited for the lock
+                question_data = _get_cached_questions(cache_key)
+                if question_data is None:
+                    # Log the exact query we're making
+                    query = {
+                        "jobRole": jobRole,
+                        "jobLevel": jobLevel,
+                        "questionType": questionType
+                    }
+                    logger.info(f"Querying MongoDB with: {query}")
+                    
+                    # Find questions based on criteria off the event loop, keeping both question text and ID
+                    question_data = await asyncio.to_thread(_find_question_data, query)
+                    
+                    # Only cache non-empty results so newly added questions show up immediately
+                    if question_data:
+                        _questions_cache[cache_key] = (time.monotonic() + QUESTIONS_CACHE_TTL, question_data)
+                        _questions_cache.move_to_end(cache_key)
+                        while len(_questions_cache) > QUESTIONS_CACHE_MAX_SIZE:
+                            _questions_cache.popitem(last=False)
+        else:
+            logger.debug(f"Serving {len(question_data)} cached questions for {jobRole} {jobLevel} {questionType}")
         
-        # Extract question data with both text and ID
-        question_data = [
-            {
-                "id": str(doc["_id"]),
-                "text": doc["question"]
-            } for doc in questions
-        ]
+        # Copy the cached entries so sessions never share mutable question data
+        question_data = [dict(q) for q in question_data]
         
         # Also extract just the question texts for backward compatibility
         question_texts = [q["text"] for q in question_data]
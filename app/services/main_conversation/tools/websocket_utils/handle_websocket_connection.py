@@ -19,6 +19,7 @@ Dependencies:
 - app.services.main_conversation.tools.websocket_utils.handle_user_message: For processing individual user messages.
 - app.services.transcription.transcriber: For transcribing audio.
 - app.errors.exceptions: For InternalServerError handling.
+- orjson: For fast JSON encoding and decoding of WebSocket messages.
 
 Author: @kcaparas1630
 """
@@ -37,13 +38,23 @@ from app.services.facial_landmarks_analysis.facial_landmarks_analysis import fac
 from app.core.ai_client_manager import get_facial_analysis_client
 from app.services.main_conversation.tools.unified_feedback import store_facial_analysis_and_check_unified_feedback
 import asyncio
-from typing import Optional
+from typing import Optional, Union
+import orjson
 import time
+import traceback
+
+async def send_json(websocket: WebSocket, data: dict):
+    """Send a JSON text frame, encoded with orjson instead of the stdlib json module."""
+    await websocket.send_text(orjson.dumps(data).decode())
+
+async def receive_json(websocket: WebSocket) -> dict:
+    """Receive a JSON text frame and decode it with orjson."""
+    return orjson.loads(await websocket.receive_text())
 
 async def send_websocket_message(websocket: WebSocket, message_type: str, content: str,       
   state: dict = None, next_question: dict = None):
       """Send a WebSocket message with consistent formatting."""
-      await websocket.send_json(WebSocketMessage(
+      await send_json(websocket, WebSocketMessage(
           type=message_type,
           content=content,
           state=state,
@@ -53,27 +64,32 @@ async def send_websocket_message(websocket: WebSocket, message_type: str, conten
 
 async def send_error_message(websocket: WebSocket, error_message: str):
     """Send an error message to the WebSocket client."""
-    await websocket.send_json({
+    await send_json(websocket, {
         "type": "error",
         "content": error_message,
         "timestamp": str(int(time.time() * 1000))
     })
 
-async def safe_transcribe(transcriber: TranscriberService, audio_data: str) -> Optional[str]:
+async def safe_transcribe(transcriber: TranscriberService, audio_data: Union[bytes, str], batched: bool = False) -> Optional[str]:
     """
-    Safely transcribe audio data with error handling.
+    Safely transcribe audio data with error handling, off the event loop.
+    Accepts raw audio bytes from the buffer or a base64 string from legacy audio messages.
+    Complete recordings should pass batched=True to use batched decoding.
     """
     transcription_start = time.time()
     try:
-        logger.debug(f"Starting transcription of {len(audio_data)} chars of audio data")
-        transcript = transcriber.transcribe_base64_audio(audio_data)
+        logger.debug("Starting transcription of {} bytes of audio data", len(audio_data))
+        if isinstance(audio_data, str):
+            transcript = await transcriber.atranscribe_base64_audio(audio_data, batched=batched)
+        else:
+            transcript = await transcriber.atranscribe_audio_bytes(audio_data, batched=batched)
         transcription_time = time.time() - transcription_start
         
         if transcript and transcript.strip():
-            logger.debug(f"Transcription completed in {transcription_time:.3f}s, result: {len(transcript)} chars")
+            logger.debug("Transcription completed in {:.3f}s, result: {} chars", transcription_time, len(transcript))
             return transcript.strip()
         else:
-            logger.debug(f"Transcription completed in {transcription_time:.3f}s, but result was empty")
+            logger.debug("Transcription completed in {:.3f}s, but result was empty", transcription_time)
             return None
     except Exception as e:
         transcription_time = time.time() - transcription_start
@@ -92,25 +108,25 @@ async def process_transcript(transcript: str, websocket: WebSocket, session: Int
         
         # Send transcript confirmation to client
         transcript_send_start = time.time()
-        await websocket.send_json({
+        await send_json(websocket, {
             "type": "transcript",
             "content": transcript,
             "timestamp": str(int(time.time() * 1000))  # Add this line
         })
         transcript_send_time = time.time() - transcript_send_start
-        logger.debug(f"Sent transcript to client in {transcript_send_time:.3f}s")
+        logger.debug("Sent transcript to client in {:.3f}s", transcript_send_time)
         
         # Process AI response
         ai_processing_start = time.time()
         response, session_state = await handle_user_message(user_message)
         ai_processing_time = time.time() - ai_processing_start
-        logger.debug(f"AI processing completed in {ai_processing_time:.3f}s")
+        logger.debug("AI processing completed in {:.3f}s", ai_processing_time)
         
         # Send AI response
         response_send_start = time.time()
         await send_response(websocket, response, session_state)
         response_send_time = time.time() - response_send_start
-        logger.debug(f"Sent AI response to client in {response_send_time:.3f}s")
+        logger.debug("Sent AI response to client in {:.3f}s", response_send_time)
         
         total_process_time = time.time() - process_start_time
         logger.info(f"Complete transcript processing took {total_process_time:.3f}s (transcript: {transcript_send_time:.3f}s, AI: {ai_processing_time:.3f}s, response: {response_send_time:.3f}s)")
@@ -123,12 +139,11 @@ async def send_response(websocket: WebSocket, response: str, session_state: dict
     try:
         if response.startswith("NEXT_QUESTION:"):
             # Parse and send structured next question data
-            import json
             try: 
                 data_json = response[14:]  # Remove "NEXT_QUESTION:" prefix
-                response_data = json.loads(data_json)
-                logger.debug(f"Parsed NEXT_QUESTION data: {response_data}")
-            except json.JSONDecodeError as e:
+                response_data = orjson.loads(data_json)
+                logger.debug("Parsed NEXT_QUESTION data: {}", response_data)
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse NEXT_QUESTION data: {e}")
                 await send_error_message(websocket, "Invalid NEXT_QUESTION data format")
                 return
@@ -152,21 +167,20 @@ async def send_response(websocket: WebSocket, response: str, session_state: dict
                 "timestamp": str(int(time.time() * 1000))
             }
             
-            await websocket.send_json(comprehensive_response)
+            await send_json(websocket, comprehensive_response)
         elif response.startswith("INTERVIEW_COMPLETE:"):
             # Parse and send interview completion data
-            import json
             try:
                 data_json = response[19:]  # Remove "INTERVIEW_COMPLETE:" prefix
-                response_data = json.loads(data_json)
-            except json.JSONDecodeError as e:
+                response_data = orjson.loads(data_json)
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse INTERVIEW_COMPLETE data: {e}")
                 await send_error_message(websocket, "Invalid INTERVIEW_COMPLETE data format")
                 return
             
             # TODO: REMOVE - This sends text analysis feedback in interview completion to WebSocket client
             # Should be replaced with unified feedback logic using stored session analysis
-            await websocket.send_json({
+            await send_json(websocket, {
                 "type": "interview_complete",
                 "content": response_data["feedback"],
                 "message": response_data["message"],
@@ -199,7 +213,7 @@ async def handle_websocket_connection(websocket: WebSocket):
     overlap_chunks = 2  # Number of chunks to overlap for context
 
     try:
-        initial_message: dict = await websocket.receive_json()
+        initial_message: dict = await receive_json(websocket)
         logger.info(f"Received initial message: {initial_message}")
         
         session = InterviewSession(**initial_message['content'])
@@ -213,14 +227,14 @@ async def handle_websocket_connection(websocket: WebSocket):
         while True:
             try:
                 raw_message: dict = await asyncio.wait_for(
-                    websocket.receive_json(), 
+                    receive_json(websocket), 
                     timeout=30.0
                 )
                 
                 message_type = raw_message.get("type")
                 
                 if message_type in ["ping", "heartbeat"]:
-                    await websocket.send_json({
+                    await send_json(websocket, {
                         "type": "heartbeat",
                         "content": "pong",
                         "timestamp": str(int(time.time() * 1000))
@@ -235,7 +249,11 @@ async def handle_websocket_connection(websocket: WebSocket):
                         await send_error_message(websocket, "Missing 'data' field for audio chunk")
                         continue
                     
+                    was_full = audio_buffer.is_full
                     audio_buffer.add_chunk(chunk_data, is_speaking)
+                    if audio_buffer.is_full and not was_full:
+                        # Tell the client once; the audio received so far is still transcribed
+                        await send_error_message(websocket, "Recording limit reached, further audio for this answer is not transcribed")
                     
                     # Check if we should do incremental transcription
                     if audio_buffer.should_do_incremental_transcription():
@@ -244,17 +262,17 @@ async def handle_websocket_connection(websocket: WebSocket):
                         # Choose transcription strategy
                         if use_overlapping_transcription:
                             # Use overlapping audio data to avoid missing words at chunk boundaries
-                            incremental_audio = audio_buffer.get_overlapping_audio_data(overlap_chunks=overlap_chunks)
+                            incremental_audio = audio_buffer.get_overlapping_audio_bytes(overlap_chunks=overlap_chunks)
                             strategy = "overlapping"
                         else:
                             # Use only new chunks since last transcription
-                            incremental_audio = audio_buffer.get_incremental_audio_data()
+                            incremental_audio = audio_buffer.get_incremental_audio_bytes()
                             strategy = "new-chunks-only"
                         
                         if incremental_audio:
                             # Calculate how many NEW chunks we're processing
-                            new_chunks_count = len(audio_buffer.chunks) - audio_buffer.last_incremental_size
-                            logger.debug(f"Attempting {strategy} incremental transcription with {new_chunks_count} new chunks (total: {len(audio_buffer.chunks)})")
+                            new_chunks_count = len(audio_buffer) - audio_buffer.last_incremental_size
+                            logger.debug("Attempting {} incremental transcription with {} new chunks (total: {})", strategy, new_chunks_count, len(audio_buffer))
                             
                             # Try to transcribe the new audio
                             transcript = await safe_transcribe(transcriber, incremental_audio)
@@ -264,9 +282,9 @@ async def handle_websocket_connection(websocket: WebSocket):
                             if transcript and transcript != last_incremental_transcript:
                                 await send_websocket_message(websocket, "incremental_transcript", transcript)
                                 last_incremental_transcript = transcript
-                                logger.debug(f"Sent incremental transcript ({strategy}, {transcription_time:.2f}s): {transcript[:50]}...")
+                                logger.debug("Sent incremental transcript ({}, {:.2f}s): {}...", strategy, transcription_time, transcript[:50])
                             else:
-                                logger.debug(f"Skipped duplicate/empty transcript ({strategy}, {transcription_time:.2f}s)")
+                                logger.debug("Skipped duplicate/empty transcript ({}, {:.2f}s)", strategy, transcription_time)
                             
                             # Mark that we've done incremental transcription
                             audio_buffer.mark_incremental_transcription_done()
@@ -283,17 +301,17 @@ async def handle_websocket_connection(websocket: WebSocket):
                         # Force final transcription if we have any remaining chunks
                         if audio_buffer.has_chunks():
                             final_audio_prep_start = time.time()
-                            final_audio = audio_buffer.get_final_audio_data()
+                            final_audio = audio_buffer.get_final_audio_bytes()
                             final_audio_prep_time = time.time() - final_audio_prep_start
-                            logger.debug(f"Final audio preparation took {final_audio_prep_time:.3f}s")
+                            logger.debug("Final audio preparation took {:.3f}s", final_audio_prep_time)
                             
                             if final_audio:
-                                logger.debug(f"Processing final transcription with {len(audio_buffer.chunks)} chunks, audio size: {len(final_audio)} chars")
+                                logger.debug("Processing final transcription with {} chunks, audio size: {} bytes", len(audio_buffer), len(final_audio))
                                 
                                 final_transcription_start = time.time()
-                                transcript = await safe_transcribe(transcriber, final_audio)
+                                transcript = await safe_transcribe(transcriber, final_audio, batched=True)
                                 final_transcription_time = time.time() - final_transcription_start
-                                logger.debug(f"Final transcription took {final_transcription_time:.3f}s")
+                                logger.debug("Final transcription took {:.3f}s", final_transcription_time)
                                 
                                 if transcript:
                                     logger.info(f"Final transcript ({len(transcript)} chars): {transcript}")
@@ -317,7 +335,6 @@ async def handle_websocket_connection(websocket: WebSocket):
                             await process_audio_end()
                         except Exception as e:
                             logger.error(f"Error in background audio processing: {e}")
-                            import traceback
                             logger.error(f"Full traceback: {traceback.format_exc()}")
                             # Optionally notify client of processing error
                             try:
@@ -329,12 +346,12 @@ async def handle_websocket_connection(websocket: WebSocket):
                         process_audio_end_with_error_handling(),
                         name=f"audio_end_processing_{session.session_id if session else 'unknown'}"
                     )
-                    logger.debug(f"Created background task: {task.get_name()}")
+                    logger.debug("Created background task: {}", task.get_name())
                     continue
 
                 if message_type == "emotion_features":
                     logger.info("Received emotion features request from client.")
-                    logger.debug(f"Emotion features data: {raw_message}")
+                    logger.debug("Emotion features data: {}", raw_message)
                     
                     # Extract emotion features data from the message
                     emotion_data = raw_message.get("data", {})
@@ -345,7 +362,7 @@ async def handle_websocket_connection(websocket: WebSocket):
                         await send_error_message(websocket, "No emotion data provided for emotion analysis")
                         continue
                     
-                    logger.debug(f"Received emotion features: {emotion_data}")
+                    logger.debug("Received emotion features: {}", emotion_data)
                     
                     # Validate emotion features structure
                     required_fields = ["smile", "eyeOpen", "browRaise", "mouthOpen", "tension", "symmetry", "confidence", "timestamp", "frameId"]
@@ -388,16 +405,18 @@ async def handle_websocket_connection(websocket: WebSocket):
                         await send_error_message(websocket, "Missing 'data' field for audio")
                         continue
                     
-                    transcript = await safe_transcribe(transcriber, base64_data)
+                    transcript = await safe_transcribe(transcriber, base64_data, batched=True)
                     if transcript:
                         await process_transcript(transcript, websocket, session)
                     continue
                 
                 if message_type == "message":
                     user_ws_message = WebSocketUserMessage.model_validate(raw_message)
+                    content = user_ws_message.content
                     user_message = UserMessage(
                         session_id=session.session_id,
-                        message=user_ws_message.content
+                        # Structured content arrives already decoded with the frame; encode it once for the conversation
+                        message=content if isinstance(content, str) else orjson.dumps(content).decode()
                     )
                     
                     response, session_state = await handle_user_message(user_message)
@@ -413,14 +432,14 @@ async def handle_websocket_connection(websocket: WebSocket):
                 
                 # Check if we should do final transcription due to timeout
                 if audio_buffer.should_do_final_transcription():
-                    final_audio = audio_buffer.get_final_audio_data()
+                    final_audio = audio_buffer.get_final_audio_bytes()
                     if final_audio:
-                        logger.debug(f"Timeout: Processing final transcription with {len(audio_buffer.chunks)} chunks")
+                        logger.debug("Timeout: Processing final transcription with {} chunks", len(audio_buffer))
                         
                         timeout_transcription_start = time.time()
-                        transcript = await safe_transcribe(transcriber, final_audio)
+                        transcript = await safe_transcribe(transcriber, final_audio, batched=True)
                         timeout_transcription_time = time.time() - timeout_transcription_start
-                        logger.debug(f"Timeout transcription took {timeout_transcription_time:.3f}s")
+                        logger.debug("Timeout transcription took {:.3f}s", timeout_transcription_time)
                         
                         if transcript:
                             await process_transcript(transcript, websocket, session)
@@ -429,7 +448,7 @@ async def handle_websocket_connection(websocket: WebSocket):
                         last_incremental_transcript = ""
                 
                 timeout_total_time = time.time() - timeout_start
-                logger.debug(f"Timeout handling completed in {timeout_total_time:.3f}s")
+                logger.debug("Timeout handling completed in {:.3f}s", timeout_total_time)
                 continue
                 
             except WebSocketDisconnect:
@@ -457,10 +476,10 @@ async def handle_websocket_connection(websocket: WebSocket):
         # Process any remaining chunks before closing
         if audio_buffer.has_chunks():
             try: 
-                final_audio = audio_buffer.get_final_audio_data()
+                final_audio = audio_buffer.get_final_audio_bytes()
                 if final_audio:
                     logger.info("Processing remaining chunks before closing due to disconnect")
-                    transcript = await safe_transcribe(transcriber, final_audio)
+                    transcript = await safe_transcribe(transcriber, final_audio, batched=True)
                     if transcript:
                         # Can't send to closed websocket, but we could log or save it
                         logger.info(f"Final transcript (connection closed): {transcript}")
@@ -475,3 +494,5 @@ async def handle_websocket_connection(websocket: WebSocket):
             await send_websocket_message(websocket, "error", "An unexpected error occurred in websocket connection")
         except WebSocketDisconnect:
             logger.info("WebSocket connection closed while sending error")
+    finally:
+        audio_buffer.release()
@@ -18,11 +18,13 @@ Dependencies:
 Author: @kcaparas1630
 """
 
+from typing import AsyncGenerator, List
+import asyncio
 from openai import AsyncOpenAI
 from loguru import logger
 from app.schemas.session_evaluation_schemas.session_state import InterviewFeedbackResponse
 from app.schemas.session_evaluation_schemas.interview_analysis_request import InterviewAnalysisRequest
-from app.services.speech_to_text.tools.response_feedback import response_feedback
+from app.services.speech_to_text.tools.response_feedback import response_feedback, stream_response_feedback, technical_error_response
 
 class TextAnswersService:
     """
@@ -38,9 +40,10 @@ class TextAnswersService:
     
     Attributes:
         client (AsyncOpenAI): The OpenAI client instance used for AI interactions.
+        deterministic_cache (bool): Whether identical requests are served from the response cache.
     """
     
-    def __init__(self, client: AsyncOpenAI):
+    def __init__(self, client: AsyncOpenAI, deterministic_cache: bool = False):
         """
         Initialize the service with an OpenAI client.
         
@@ -50,6 +53,8 @@ class TextAnswersService:
         Args:
             client (AsyncOpenAI): The OpenAI client instance configured with
                 appropriate API credentials and settings.
+            deterministic_cache (bool): Opt in to temperature-0 analysis with
+                identical requests served from the response cache. Defaults to False.
                 
         Example:
             >>> from openai import AsyncOpenAI
@@ -57,6 +62,7 @@ class TextAnswersService:
             >>> service = TextAnswersService(client)
         """
         self.client = client
+        self.deterministic_cache = deterministic_cache
     
     async def analyze_response(self, analysis_request: InterviewAnalysisRequest) -> InterviewFeedbackResponse:
         """
@@ -104,5 +110,72 @@ class TextAnswersService:
             >>> print(f"Score: {feedback.score}/10")
             >>> print(f"Feedback: {feedback.feedback}")
         """
-        result = await response_feedback(self.client, analysis_request)
+        result = await response_feedback(self.client, analysis_request, deterministic_cache=self.deterministic_cache)
         return result
+    
+    async def analyze_responses_batch(self, analysis_requests: List[InterviewAnalysisRequest], max_concurrency: int = 10) -> List[InterviewFeedbackResponse]:
+        """
+        Analyze several interview responses concurrently.
+        
+        All analyses are started at once and a semaphore caps how many completion
+        calls are in flight, so a batch takes roughly as long as its slowest
+        requests instead of the sum of all of them. Rate-limited calls are retried
+        with backoff by the OpenAI client itself.
+        
+        Args:
+            analysis_requests (List[InterviewAnalysisRequest]): The requests to analyze.
+            max_concurrency (int): Maximum number of concurrent completion calls,
+                sized to the provider's rate limit. Defaults to 10.
+                
+        Returns:
+            List[InterviewFeedbackResponse]: The feedback for each request, in the
+                same order as the requests. A request whose analysis raised gets
+                the technical error retry response.
+                
+        Example:
+            >>> feedbacks = await service.analyze_responses_batch([request_1, request_2])
+            >>> print([feedback.score for feedback in feedbacks])
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_one(analysis_request: InterviewAnalysisRequest) -> InterviewFeedbackResponse:
+            async with semaphore:
+                return await self.analyze_response(analysis_request)
+        
+        results = await asyncio.gather(
+            *(analyze_one(analysis_request) for analysis_request in analysis_requests),
+            return_exceptions=True
+        )
+        
+        feedbacks = []
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error("Batch analysis failed for request {}: {}", index, result)
+                result = technical_error_response()
+            elif isinstance(result, BaseException):
+                # Cancellation and interpreter exits must not be turned into feedback
+                raise result
+            feedbacks.append(result)
+        return feedbacks
+    
+    async def stream_response(self, analysis_request: InterviewAnalysisRequest) -> AsyncGenerator[InterviewFeedbackResponse, None]:
+        """
+        Analyze an interview response, yielding feedback while the completion streams.
+        
+        Provisional feedback is yielded as each top-level field of the AI response
+        completes, so callers can start rendering before the full generation is done.
+        The last item yielded is the final, fully validated feedback.
+        
+        Args:
+            analysis_request (InterviewAnalysisRequest): The request containing
+                the interview details and the candidate's response to analyze.
+                
+        Yields:
+            InterviewFeedbackResponse: Provisional feedback followed by the final result.
+            
+        Example:
+            >>> async for feedback in service.stream_response(request):
+            ...     print(f"Score so far: {feedback.score}/10")
+        """
+        async for feedback in stream_response_feedback(self.client, analysis_request):
+            yield feedback
@@ -14,24 +14,59 @@ Dependencies:
 - openai: For AI client interactions and response generation.
 - app.schemas.session_evaluation_schemas: For interview analysis and feedback data models.
 - app.helper.extract_regex_feedback: For fallback regex-based feedback extraction.
+- pydantic: For single-pass validation of well-formed feedback JSON.
+- orjson: For fast JSON parsing of AI responses.
+- json_repair: For repairing malformed JSON returned by the AI.
 - logging: For error logging and debugging.
 
 Author: @kcaparas1630
 """
 
 from openai import AsyncOpenAI
+from pydantic import ValidationError
 from app.schemas.session_evaluation_schemas.interview_analysis_request import InterviewAnalysisRequest
 from app.schemas.session_evaluation_schemas import InterviewFeedbackResponse, NextAction
 from app.schemas.session_evaluation_schemas.interview_request import InterviewRequest
 from app.helper.extract_regex_feedback import extract_regex_feedback
 from app.core.secure_prompt_manager import secure_prompt_manager, sanitize_text
+from app.core.llm_cache import llm_response_cache
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+import asyncio
+import json_repair
 import logging
+import orjson
+import os
 import re
 import time
+import traceback
 
 
 logger = logging.getLogger(__name__)
 
+# Greedy match of the outermost JSON object, compiled once for every response
+_JSON_OBJECT_RE = re.compile(r'(\{.*\})', re.DOTALL)
+
+def load_feedback_json(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse AI feedback JSON, repairing common LLM formatting defects.
+
+    Tries the fast strict parser first and falls back to a single lenient repair
+    pass (trailing commas, unquoted keys, markdown fences, truncated output).
+
+    Args:
+        content (str): The JSON content to parse.
+
+    Returns:
+        Optional[Dict[str, Any]]: The parsed object, or None if no JSON object could be recovered.
+    """
+    try:
+        feedback_data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.warning("[FEEDBACK_DEBUG] Strict JSON parsing failed, attempting repair: %s", e)
+        feedback_data = json_repair.loads(content)
+
+    return feedback_data if isinstance(feedback_data, dict) else None
+
 def clean_ai_response(content: str) -> str:
     """
     Clean AI response by removing thinking content and extracting only JSON.
@@ -85,7 +120,7 @@ def clean_ai_response(content: str) -> str:
         before_length = len(content)
         content = re.sub(pattern, '', content, flags=re.DOTALL | re.IGNORECASE)
         if len(content) != before_length:
-            logger.debug(f"Removed thinking content with pattern: {pattern[:20]}...")
+            logger.debug("Removed thinking content with pattern: %s...", pattern[:20])
             break  # Stop after first successful removal
     
     # Strip whitespace
@@ -113,18 +148,18 @@ def clean_ai_response(content: str) -> str:
     # If we still don't have JSON-like content, try to find it more aggressively
     if not content.startswith('{'):
         # Look for any JSON-like structure in the text
-        json_match = re.search(r'(\{.*\})', content, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(content)
         if json_match:
             content = json_match.group(1)
     
     # Log cleaning results
     final_length = len(content)
     if original_length != final_length:
-        logger.debug(f"AI response cleaned: {original_length} -> {final_length} chars")
+        logger.debug("AI response cleaned: %s -> %s chars", original_length, final_length)
         if final_length > 0 and content.startswith('{'):
             logger.debug("Successfully extracted JSON content")
         else:
-            logger.warning(f"Cleaning may have failed - content: {content[:100]}...")
+            logger.warning("Cleaning may have failed - content: %s...", content[:100])
     
     return content
 
@@ -181,7 +216,7 @@ def validate_ai_response(content: str) -> bool:
     
     for pattern in leak_patterns:
         if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
-            logger.warning(f"Potential system prompt leakage detected: {pattern}")
+            logger.warning("Potential system prompt leakage detected: %s", pattern)
             return False
     
     # Check for excessive length that might indicate prompt leakage
@@ -200,7 +235,7 @@ def validate_ai_response(content: str) -> bool:
     
     for pattern in suspicious_patterns:
         if re.search(pattern, content, re.IGNORECASE):
-            logger.warning(f"Suspicious content detected: {pattern}")
+            logger.warning("Suspicious content detected: %s", pattern)
             return False
     
     return True
@@ -224,20 +259,20 @@ def validate_interview_input(analysis_request: InterviewAnalysisRequest) -> Inte
     ALLOWED_QUESTION_TYPES = ["behavioral", "technical", "system-design", "coding-challenge", "hr-round"]
 
     # Validate job role
-    if analysis_request.session_metadata.jobRole not in ALLOWED_JOB_ROLES:
-        raise ValueError(f"Invalid job role: {analysis_request.session_metadata.jobRole}")
+    if analysis_request.jobRole not in ALLOWED_JOB_ROLES:
+        raise ValueError(f"Invalid job role: {analysis_request.jobRole}")
     
     # Validate job level
-    if analysis_request.session_metadata.jobLevel not in ALLOWED_JOB_LEVELS:
-        raise ValueError(f"Invalid job level: {analysis_request.session_metadata.jobLevel}")
+    if analysis_request.jobLevel not in ALLOWED_JOB_LEVELS:
+        raise ValueError(f"Invalid job level: {analysis_request.jobLevel}")
     
     # Validate interview type
     if analysis_request.interviewType not in ALLOWED_INTERVIEW_TYPES:
         raise ValueError(f"Invalid interview type: {analysis_request.interviewType}")
     
     # Validate question type
-    if analysis_request.session_metadata.questionType not in ALLOWED_QUESTION_TYPES:
-        raise ValueError(f"Invalid question type: {analysis_request.session_metadata.questionType}")
+    if analysis_request.questionType not in ALLOWED_QUESTION_TYPES:
+        raise ValueError(f"Invalid question type: {analysis_request.questionType}")
     
     # Validate question
     if not analysis_request.question:
@@ -248,17 +283,317 @@ def validate_interview_input(analysis_request: InterviewAnalysisRequest) -> Inte
         raise ValueError("Answer cannot be empty.")
     
     # Sanitize free-form text fields
-    analysis_request.session_metadata.jobRole = sanitize_text(analysis_request.session_metadata.jobRole)
-    analysis_request.session_metadata.jobLevel = sanitize_text(analysis_request.session_metadata.jobLevel)
+    analysis_request.jobRole = sanitize_text(analysis_request.jobRole)
+    analysis_request.jobLevel = sanitize_text(analysis_request.jobLevel)
     analysis_request.interviewType = sanitize_text(analysis_request.interviewType)
-    analysis_request.session_metadata.questionType = sanitize_text(analysis_request.session_metadata.questionType)
+    analysis_request.questionType = sanitize_text(analysis_request.questionType)
     analysis_request.question = sanitize_text(analysis_request.question)
     analysis_request.answer = sanitize_text(analysis_request.answer)
     
     return analysis_request
 
-async def response_feedback(client: AsyncOpenAI, analysis_request: InterviewAnalysisRequest) -> InterviewFeedbackResponse:
-    logger.info(f"[ENTRY] response_feedback function called - ENTRY POINT")
+# Analysis model; override to target a smaller or quantized deployment served
+# behind an OpenAI-compatible endpoint (see NEBIUS_BASE_URL)
+TEXT_ANALYSIS_MODEL = os.getenv("TEXT_ANALYSIS_MODEL", "meta-llama/Meta-Llama-3.1-8B-Instruct-fast")
+
+# JSON schema of the feedback, built once and sent with every request so the
+# server constrains decoding to valid feedback objects
+_FEEDBACK_JSON_SCHEMA = InterviewFeedbackResponse.model_json_schema()
+
+# Completion settings shared by the blocking and streaming analysis paths
+# (feedback JSON is ~150-250 tokens, so max_tokens only caps runaway generations)
+_COMPLETION_OPTIONS = {
+    "model": TEXT_ANALYSIS_MODEL,
+    "max_tokens": 400,
+    "temperature": 0.1,
+    "top_p": 0.8,
+    "extra_body": {
+        "guided_json": _FEEDBACK_JSON_SCHEMA
+    }
+}
+
+def build_analysis_messages(analysis_request: InterviewAnalysisRequest) -> list:
+    """
+    Validate the request and build the chat messages for response analysis.
+
+    Args:
+        analysis_request (InterviewAnalysisRequest): The interview analysis request.
+
+    Returns:
+        list: Chat completion messages with the secure system prompt and the user's answer.
+    """
+    # Validate and sanitize the input
+    analysis_request = validate_interview_input(analysis_request)
+    
+    # Use secure prompt manager to generate safe prompt messages; the static
+    # instructions go first so the provider can reuse their cached prefill
+    system_messages = secure_prompt_manager.get_response_analysis_messages(analysis_request)
+    
+    return [
+        *system_messages,
+        {
+            "role": "user",
+            "content": f"Interview Question: {analysis_request.question}\nUser Response: {analysis_request.answer}"
+        }
+    ]
+
+def parse_feedback_content(content: str, analysis_request: InterviewAnalysisRequest) -> InterviewFeedbackResponse:
+    """
+    Turn the raw AI message content into an InterviewFeedbackResponse.
+
+    Cleans thinking content, validates the response against system prompt leakage,
+    then parses the JSON (repairing common defects) with a regex-based fallback
+    for output that cannot be recovered.
+
+    Args:
+        content (str): The raw AI message content.
+        analysis_request (InterviewAnalysisRequest): The request that was analyzed.
+
+    Returns:
+        InterviewFeedbackResponse: The parsed feedback.
+    """
+    return _parse_feedback_content(content, analysis_request)[0]
+
+def _parse_feedback_content(content: str, analysis_request: InterviewAnalysisRequest) -> Tuple[InterviewFeedbackResponse, bool]:
+    """
+    Parse the raw AI message content, reporting whether it was schema-valid.
+
+    Returns:
+        Tuple[InterviewFeedbackResponse, bool]: The parsed feedback and True only when
+        the content validated against the schema as-is, i.e. no repair or fallback was used.
+    """
+    # Log the raw AI response for debugging
+    logger.info("[AI_EVALUATION] Raw AI response: %s", content)
+    logger.info("[AI_EVALUATION] Response length: %s characters", len(content))
+    # Check if content is already valid JSON before cleaning
+    try:
+        orjson.loads(content.strip())
+        # Content is already valid JSON, just strip whitespace
+        content = content.strip()
+    except orjson.JSONDecodeError:
+        # Clean the response by removing thinking tags and any content before JSON
+        content = clean_ai_response(content)
+    
+    # Log the cleaned content
+    logger.info("[FEEDBACK_DEBUG] Final content: %s", content)
+    
+    # Validate the AI response to prevent system prompt leakage
+    if not validate_ai_response(content):
+        logger.error("AI response validation failed. Content: %s", content)
+        return retry_response("security issue"), False
+
+    # Fast path: well-formed feedback is parsed and validated in a single pass
+    try:
+        return InterviewFeedbackResponse.model_validate_json(content), True
+    except ValidationError:
+        logger.info("[FEEDBACK_DEBUG] Response is not schema-valid feedback, parsing leniently")
+    
+    # parse the JSON response first, repairing it if needed.
+    feedback_data = load_feedback_json(content)
+    if feedback_data is None:
+        # Log the content for debugging
+        logger.error("Content that failed to parse: %s", content)
+        
+        # Fallback to regex-based parsing with the original question and response
+        request = InterviewRequest(question=analysis_request.question, answer=analysis_request.answer)
+        return extract_regex_feedback(content, request), False
+    
+    # Log the parsed JSON for debugging
+    logger.info("[FEEDBACK_DEBUG] Successfully parsed JSON: %s", feedback_data)
+    
+    next_action_data = feedback_data.get("next_action")
+    if not next_action_data:
+        # Check if the AI returned next_action fields at root level instead of nested
+        if "type" in feedback_data and "message" in feedback_data:
+            logger.info("[FEEDBACK_DEBUG] Found next_action fields at root level, converting to nested format")
+            next_action = NextAction(
+                type=feedback_data.get("type", "continue"),
+                message=feedback_data.get("message", "Please continue.")
+            )
+        else:
+            logger.warning("[FEEDBACK_DEBUG] Missing next_action in AI response. Available keys: %s", list(feedback_data.keys()))
+            next_action = NextAction(
+                type="retry_question",
+                message="There was a technical error analyzing your response. Please try answering the question again."
+            )
+    else:
+        logger.info("[FEEDBACK_DEBUG] Found next_action: %s", next_action_data)
+        next_action = NextAction(**next_action_data)  # Convert dict to NextAction
+
+    # Create the response object
+    return InterviewFeedbackResponse(
+        score=feedback_data.get("score", 0),
+        feedback=feedback_data.get("feedback", ""),
+        strengths=feedback_data.get("strengths", []),
+        tips=feedback_data.get("tips", []),
+        technical_issue_detected=feedback_data.get("technical_issue_detected", False),
+        needs_retry=feedback_data.get("needs_retry", False),
+        next_action=next_action
+    ), False
+
+def retry_response(reason: str) -> InterviewFeedbackResponse:
+    """
+    Build the zero-score response asking the user to retry the question.
+
+    Args:
+        reason (str): Short description of why the analysis failed (e.g. "technical error").
+
+    Returns:
+        InterviewFeedbackResponse: The retry response.
+    """
+    return InterviewFeedbackResponse(
+        score=0,
+        feedback=f"Unable to analyze the response due to a {reason}.",
+        strengths=["N/A"],
+        tips=["Please try again later."],
+        technical_issue_detected=True,
+        needs_retry=True,
+        next_action=NextAction(
+            type="retry_question",
+            message=f"There was a {reason} analyzing your response. Please try answering the question again."
+        )
+    )
+
+def technical_error_response() -> InterviewFeedbackResponse:
+    """Build the retry response returned when the analysis itself fails."""
+    return retry_response("technical error")
+
+# Answers this short, ending in a trailing conjunction/filler or ellipsis, or
+# carrying a transcription marker are cut-offs the model would send back for a retry
+_MIN_ANSWER_LENGTH = 20
+_TRAILING_CUTOFF_RE = re.compile(r"(?:\.\.\.|\u2026|\b(?:and|but|the|um|uh))\s*$", re.IGNORECASE)
+_TRANSCRIPTION_ISSUE_MARKERS = ("[inaudible]", "[unintelligible]", "[blank_audio]")
+
+_TECHNICAL_ISSUE_RESPONSE = InterviewFeedbackResponse(
+    score=0,
+    feedback="Your response appears to have been cut off or was not captured clearly.",
+    strengths=[],
+    tips=["Make sure your microphone is working and answer the question in full."],
+    technical_issue_detected=True,
+    needs_retry=True,
+    next_action=NextAction(
+        type="retry_question",
+        message="It looks like we had some technical difficulties. Let's give that another try."
+    )
+)
+
+def _is_obvious_technical_issue(answer: str) -> bool:
+    """
+    Check whether an answer is an obvious cut-off or transcription failure.
+
+    Args:
+        answer (str): The candidate's answer.
+
+    Returns:
+        bool: True if the answer should be retried without asking the model.
+    """
+    stripped = answer.strip()
+    if len(stripped) < _MIN_ANSWER_LENGTH or _TRAILING_CUTOFF_RE.search(stripped):
+        return True
+    lowered = stripped.lower()
+    return any(marker in lowered for marker in _TRANSCRIPTION_ISSUE_MARKERS)
+
+def technical_issue_response() -> InterviewFeedbackResponse:
+    """Get the retry response for answers that were cut off or not captured."""
+    return _TECHNICAL_ISSUE_RESPONSE.model_copy(deep=True)
+
+class StreamingFieldParser:
+    """
+    Incrementally track which top-level fields of a streamed JSON object are complete.
+
+    Tokens are fed as they arrive; the parser keeps its brace/bracket depth and string
+    state between calls so each character is scanned once. A top-level field is
+    complete when a comma is seen at depth 1, or when the object itself closes.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._scanned = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._boundary = -1
+        self.closed = False
+
+    def feed(self, text: str) -> bool:
+        """
+        Add streamed text to the buffer.
+
+        Returns:
+            bool: True if at least one more top-level field completed.
+        """
+        self.buffer += text
+        previous_boundary = self._boundary
+        buffer = self.buffer
+        for i in range(self._scanned, len(buffer)):
+            if self.closed:
+                break
+            ch = buffer[i]
+            if self._start == -1:
+                if ch == "{":
+                    self._start = i
+                    self._depth = 1
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._boundary = i
+                    self.closed = True
+            elif ch == "," and self._depth == 1:
+                self._boundary = i
+        self._scanned = len(buffer)
+        return self._boundary != previous_boundary
+
+    def completed_text(self) -> Optional[str]:
+        """Return the JSON text of the object truncated to its completed fields."""
+        if self._boundary == -1:
+            return None
+        if self.closed:
+            return self.buffer[self._start:self._boundary + 1]
+        return self.buffer[self._start:self._boundary] + "}"
+
+def partial_feedback_response(fields: Dict[str, Any]) -> InterviewFeedbackResponse:
+    """Build a provisional InterviewFeedbackResponse from the fields streamed so far."""
+    next_action_data = fields.get("next_action") or {}
+    return InterviewFeedbackResponse(
+        score=fields.get("score", 0),
+        feedback=fields.get("feedback", ""),
+        strengths=fields.get("strengths", []),
+        tips=fields.get("tips", []),
+        technical_issue_detected=fields.get("technical_issue_detected", False),
+        needs_retry=fields.get("needs_retry", False),
+        next_action=NextAction(
+            type=next_action_data.get("type", "continue"),
+            message=next_action_data.get("message", "")
+        )
+    )
+
+def feedback_cache_key(analysis_request: InterviewAnalysisRequest) -> str:
+    """Build the response cache key for a validated analysis request."""
+    return llm_response_cache.make_key(
+        model=_COMPLETION_OPTIONS["model"],
+        jobRole=analysis_request.jobRole,
+        jobLevel=analysis_request.jobLevel,
+        interviewType=analysis_request.interviewType,
+        questionType=analysis_request.questionType,
+        question=analysis_request.question,
+        answer=analysis_request.answer
+    )
+
+async def response_feedback(client: AsyncOpenAI, analysis_request: InterviewAnalysisRequest, deterministic_cache: bool = False) -> InterviewFeedbackResponse:
+    logger.info("[ENTRY] response_feedback function called - ENTRY POINT")
     """
     Analyze an interview response and generate comprehensive feedback.
     
@@ -281,6 +616,8 @@ async def response_feedback(client: AsyncOpenAI, analysis_request: InterviewAnal
             - questionType: The type of question being analyzed
             - question: The interview question that was asked
             - answer: The candidate's response to analyze
+        deterministic_cache (bool): When True, sample at temperature 0 and serve
+            identical requests from the response cache instead of calling the model.
             
     Returns:
         InterviewFeedbackResponse: A structured feedback object containing:
@@ -316,151 +653,151 @@ async def response_feedback(client: AsyncOpenAI, analysis_request: InterviewAnal
        
         total_start_time = time.time()
         
-        # Validate and sanitize the input
-        analysis_request = validate_interview_input(analysis_request)
+        # Obvious cut-offs always come back as a retry, so skip the LLM round-trip
+        if _is_obvious_technical_issue(analysis_request.answer):
+            logger.info("[FEEDBACK_DEBUG] Answer looks cut off, returning technical issue response")
+            return technical_issue_response()
         
-        # Use secure prompt manager to generate safe prompt
-        system_prompt = secure_prompt_manager.get_response_analysis_prompt(analysis_request)
+        messages = build_analysis_messages(analysis_request)
+        
+        completion_options = _COMPLETION_OPTIONS
+        if deterministic_cache:
+            cache_key = feedback_cache_key(analysis_request)
+            cached = await llm_response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("[CACHE] Serving response_feedback from cache")
+                return InterviewFeedbackResponse.model_validate_json(cached)
+            # Cached answers are only meaningful if the model output is reproducible
+            completion_options = {**_COMPLETION_OPTIONS, "temperature": 0}
         
         llm_start_time = time.time()
         
-        response = await client.chat.completions.create(
-            model="meta-llama/Meta-Llama-3.1-8B-Instruct-fast",
-            max_tokens=1000,
-            temperature=0.1,
-            top_p=0.9,
-            extra_body={
-                "top_k": 50
-            },
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"""Interview Question: {analysis_request.question}
-User Response: {analysis_request.answer}"""
-                        }
-                    ]
-                }
-            ]
+        raw_response = await client.chat.completions.with_raw_response.create(
+            messages=messages,
+            **completion_options
         )
         
         # Parse the response into our schema format
         llm_duration = time.time() - llm_start_time
-        logger.info(f"LLM call completed in {llm_duration:.3f}s")
+        logger.info("LLM call completed in %.3fs", llm_duration)
         
-        content = response.choices[0].message.content
+        # Only the message content is needed, so read it straight from the JSON body
+        # instead of validating the full ChatCompletion model tree
+        content = orjson.loads(raw_response.content)["choices"][0]["message"]["content"]
         
-        # Log the raw AI response for debugging
-        logger.info(f"[AI_EVALUATION] Raw AI response: {content}")
-        logger.info(f"[AI_EVALUATION] Response length: {len(content)} characters")
-        # Check if content is already valid JSON before cleaning
-        try:
-            import json
-            json.loads(content.strip())
-            # Content is already valid JSON, just strip whitespace
-            content = content.strip()
-        except json.JSONDecodeError:
-            # Clean the response by removing thinking tags and any content before JSON
-            content = clean_ai_response(content)
+        feedback_response, schema_valid = _parse_feedback_content(content, analysis_request)
         
-        # Log the cleaned content
-        logger.info(f"[FEEDBACK_DEBUG] Final content: {content}")
+        # Repaired, fallback and retry results are not reproducible answers, so never cache them
+        if deterministic_cache and schema_valid and not feedback_response.needs_retry:
+            await llm_response_cache.set(cache_key, feedback_response.model_dump_json())
         
-        # Validate the AI response to prevent system prompt leakage
-        if not validate_ai_response(content):
-            logger.error(f"AI response validation failed. Content: {content}")
-            return InterviewFeedbackResponse(
-                score=0,
-                feedback="Unable to analyze the response due to a security issue.",
-                strengths=["N/A"],
-                tips=["Please try again later."],
-                technical_issue_detected=True,
-                needs_retry=True,
-                next_action=NextAction(
-                    type="retry_question",
-                    message="There was a security issue analyzing your response. Please try answering the question again."
-                )
-            )
+        total_duration = time.time() - total_start_time
+        logger.info("[PERF] Total response_feedback completed in %.3fs", total_duration)
+        return feedback_response
+            
+    except Exception as e:
+        logger.error("[ERROR] Exception in response_feedback: %s: %s", type(e).__name__, e)
+        logger.error("[ERROR] Exception occurred at: %.3fs after start", time.time() - total_start_time)
+        logger.error("[ERROR] Full traceback: %s", traceback.format_exc())
+        # Return a basic response in case of error
+        return technical_error_response()
 
-        # Create a request object with the original question and response
-        request = InterviewRequest(question=analysis_request.question, answer=analysis_request.answer)
+async def stream_response_feedback(client: AsyncOpenAI, analysis_request: InterviewAnalysisRequest) -> AsyncGenerator[InterviewFeedbackResponse, None]:
+    """
+    Analyze an interview response, yielding feedback as the completion streams in.
+
+    The completion is requested with stream=True and a provisional
+    InterviewFeedbackResponse is yielded every time another top-level JSON field
+    (score, feedback, strengths, ...) finishes streaming, so callers can start
+    rendering before generation is done. The last item yielded is always the
+    fully parsed and validated response, identical to what response_feedback returns.
+
+    Args:
+        client (AsyncOpenAI): The OpenAI client instance.
+        analysis_request (InterviewAnalysisRequest): The request to analyze.
+
+    Yields:
+        InterviewFeedbackResponse: Provisional responses followed by the final response.
+
+    Example:
+        >>> async for feedback in stream_response_feedback(client, request):
+        ...     print(feedback.score, feedback.feedback)
+    """
+    total_start_time = time.time()
+    try:
+        if _is_obvious_technical_issue(analysis_request.answer):
+            logger.info("[FEEDBACK_DEBUG] Answer looks cut off, returning technical issue response")
+            yield technical_issue_response()
+            return
         
-        # parse the JSON response first.
-        try:
-            import json
-            feedback_data = json.loads(content)
-            
-            # Log the parsed JSON for debugging
-            logger.info(f"[FEEDBACK_DEBUG] Successfully parsed JSON: {feedback_data}")
-            
-            # Check specific keys
-            
-            # After feedback_data = json.loads(content)
-            next_action_data = feedback_data.get("next_action")
-            if not next_action_data:
-                # Check if the AI returned next_action fields at root level instead of nested
-                if "type" in feedback_data and "message" in feedback_data:
-                    logger.info(f"[FEEDBACK_DEBUG] Found next_action fields at root level, converting to nested format")
-                    next_action = NextAction(
-                        type=feedback_data.get("type", "continue"),
-                        message=feedback_data.get("message", "Please continue.")
-                    )
-                else:
-                    logger.warning(f"[FEEDBACK_DEBUG] Missing next_action in AI response. Available keys: {list(feedback_data.keys())}")
-                    next_action = NextAction(
-                        type="retry_question",
-                        message="There was a technical error analyzing your response. Please try answering the question again."
-                    )
-            else:
-                logger.info(f"[FEEDBACK_DEBUG] Found next_action: {next_action_data}")
-                next_action = NextAction(**next_action_data)  # Convert dict to NextAction
-
-            # Create the response object
-            feedback_response = InterviewFeedbackResponse(
-                score=feedback_data.get("score", 0),
-                feedback=feedback_data.get("feedback", ""),
-                strengths=feedback_data.get("strengths", []),
-                tips=feedback_data.get("tips", []),
-                technical_issue_detected=feedback_data.get("technical_issue_detected", False),
-                needs_retry=feedback_data.get("needs_retry", False),
-                next_action=next_action
-            )
-            
-            
-            total_duration = time.time() - total_start_time
-            logger.info(f"[PERF] Total response_feedback completed in {total_duration:.3f}s")
-            return feedback_response
-            
-        except json.JSONDecodeError as e:
-            # Log the error and content for debugging
-            logger.error(f"JSON parsing error: {e}")
-            logger.error(f"Content that failed to parse: {content}")
+        messages = build_analysis_messages(analysis_request)
+        
+        stream = await client.chat.completions.create(
+            messages=messages,
+            stream=True,
+            **_COMPLETION_OPTIONS
+        )
+        
+        parser = StreamingFieldParser()
+        first_token_time = None
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            if first_token_time is None:
+                first_token_time = time.time() - total_start_time
+                logger.info("[PERF] First token received in %.3fs", first_token_time)
             
-            # Fallback to regex-based parsing
-            return extract_regex_feedback(content, request)
+            if not parser.feed(delta) or parser.closed:
+                continue
             
+            # Only surface partial content that passes the same leakage checks as the final response
+            completed_text = parser.completed_text()
+            if not validate_ai_response(completed_text):
+                continue
+            try:
+                yield partial_feedback_response(orjson.loads(completed_text))
+            except (orjson.JSONDecodeError, ValueError, AttributeError) as e:
+                logger.debug("[STREAM] Skipping unparseable partial feedback: %s", e)
+        
+        yield parse_feedback_content(parser.buffer, analysis_request)
+        
+        total_duration = time.time() - total_start_time
+        logger.info("[PERF] Total stream_response_feedback completed in %.3fs", total_duration)
+        
     except Exception as e:
-        logger.error(f"[ERROR] Exception in response_feedback: {type(e).__name__}: {e}")
-        logger.error(f"[ERROR] Exception occurred at: {time.time() - total_start_time:.3f}s after start")
-        import traceback
-        logger.error(f"[ERROR] Full traceback: {traceback.format_exc()}")
-        # Return a basic response in case of error
-        return InterviewFeedbackResponse(
-            score=0,
-            feedback="Unable to analyze the response due to a technical error.",
-            strengths=["N/A"],
-            tips=["Please try again later."],
-            engagement_check=False,
-            technical_issue_detected=True,
-            needs_retry=True,
-            next_action=NextAction(
-                type="retry_question",
-                message="There was a technical error analyzing your response. Please try answering the question again."
-            )
-        ) 
+        logger.error("[ERROR] Exception in stream_response_feedback: %s: %s", type(e).__name__, e)
+        yield technical_error_response()
+
+async def response_feedback_streaming(client: AsyncOpenAI, analysis_request: InterviewAnalysisRequest, out_queue: asyncio.Queue) -> InterviewFeedbackResponse:
+    """
+    Analyze an interview response, publishing feedback to a queue as it streams in.
+
+    Meant to be run as a background task so downstream stages (e.g. preparing the
+    next turn) can consume provisional feedback while the analysis is still
+    finishing. Every response yielded by stream_response_feedback is put on the
+    queue, followed by None once the analysis is done.
+
+    Args:
+        client (AsyncOpenAI): The OpenAI client instance.
+        analysis_request (InterviewAnalysisRequest): The request to analyze.
+        out_queue (asyncio.Queue): Queue receiving provisional and final feedback, then None.
+
+    Returns:
+        InterviewFeedbackResponse: The final feedback, also the last item put on the queue.
+
+    Example:
+        >>> queue = asyncio.Queue()
+        >>> task = asyncio.create_task(response_feedback_streaming(client, request, queue))
+        >>> while (feedback := await queue.get()) is not None:
+        ...     print(feedback.feedback)
+    """
+    feedback_response = technical_error_response()
+    try:
+        async for feedback_response in stream_response_feedback(client, analysis_request):
+            await out_queue.put(feedback_response)
+    finally:
+        await out_queue.put(None)
+    return feedback_response
@@ -1,141 +1,199 @@
-from collections import deque
 import time
-import base64
-from typing import Optional
+import pybase64
+from typing import List, Optional
 from loguru import logger
 
+# Last-resort cap on the decoded audio held per session (roughly half an hour of
+# browser Opus); chunks past it are dropped rather than growing the buffer forever
+MAX_BUFFER_BYTES = 8 * 1024 * 1024
+
+# Decoded-audio bytearrays returned by finished sessions, reused by new ones so
+# their already-grown storage isn't freed and reallocated on every connection
+_BUFFER_POOL: List[bytearray] = []
+_BUFFER_POOL_MAX_SIZE = 8
+# Buffers grown past this (a few minutes of audio) are freed instead of pooled, so
+# a handful of long sessions can't pin MAX_BUFFER_BYTES per pool slot for good
+_BUFFER_POOL_MAX_CAPACITY = 1024 * 1024
+
+def _acquire_buffer() -> bytearray:
+    """Take a bytearray from the pool, or allocate a new one if the pool is empty."""
+    return _BUFFER_POOL.pop() if _BUFFER_POOL else bytearray()
+
+def _release_buffer(buf: bytearray):
+    """Return a bytearray to the pool unless the pool is full or the buffer is oversized."""
+    if len(buf) <= _BUFFER_POOL_MAX_CAPACITY and len(_BUFFER_POOL) < _BUFFER_POOL_MAX_SIZE:
+        _BUFFER_POOL.append(buf)
+
 class IncrementalAudioBuffer:
     """
     Optimized audio buffer that accumulates chunks and provides incremental transcription
     by transcribing only NEW chunks since the last incremental transcription.
+    
+    Chunks are base64-decoded once when added and appended to a single rolling
+    buffer; the start offset of each chunk is recorded so any range of chunks
+    can be sliced out without decoding or copying them again. The rolling buffer
+    comes from a module-level pool and keeps its capacity across clear(); only
+    the first _size bytes are live. Call release() when the session ends; buffers
+    past _BUFFER_POOL_MAX_CAPACITY are freed rather than pooled.
+    
+    The final transcription needs the whole answer, so nothing is trimmed from the
+    front; instead the buffer stops accepting chunks once max_buffer_bytes is reached.
     """
     
-    def __init__(self, incremental_size_threshold: int = 5, final_timeout: float = 2.0):
-        self.chunks = deque()
+    def __init__(self, incremental_size_threshold: int = 5, final_timeout: float = 2.0,
+                 max_buffer_bytes: int = MAX_BUFFER_BYTES):
+        self._decoded = _acquire_buffer()
+        self._size = 0
+        self._offsets: List[int] = []
         self.incremental_size_threshold = incremental_size_threshold
         self.final_timeout = final_timeout
+        self.max_buffer_bytes = max_buffer_bytes
+        self.is_full = False
         self.last_chunk_time = None
         self.last_incremental_size = 0
         self.is_speaking = False
         
-    def add_chunk(self, chunk_data: str, is_speaking: bool = True):
-        """Add a chunk and update speaking state."""
-        self.chunks.append(chunk_data)
+    def __len__(self) -> int:
+        """Number of chunks in the buffer."""
+        return len(self._offsets)
+        
+    def add_chunk(self, chunk_data: str, is_speaking: bool = True) -> bool:
+        """
+        Decode and add a chunk and update speaking state.
+        
+        The speaking state and chunk time are updated even when the chunk's audio
+        is dropped, so a final isSpeaking=False chunk still ends the utterance.
+        
+        Returns:
+            bool: True if the chunk's audio was stored, False if it failed to decode
+                or the buffer is full (see is_full).
+        """
         self.last_chunk_time = time.time()
         self.is_speaking = is_speaking
+        try:
+            chunk_bytes = pybase64.b64decode(chunk_data, validate=False)
+        except Exception as e:
+            logger.error("Error decoding audio chunk, skipping it: {}", e)
+            return False
+        end = self._size + len(chunk_bytes)
+        if end > self.max_buffer_bytes:
+            if not self.is_full:
+                logger.warning("Audio buffer reached {} bytes, dropping further chunks", self.max_buffer_bytes)
+                self.is_full = True
+            return False
+        self._offsets.append(self._size)
+        # Overwrites stale bytes left from earlier use, growing the buffer only when needed
+        self._decoded[self._size:end] = chunk_bytes
+        self._size = end
+        return True
+        
+    def _combine_chunks(self, start_idx: int) -> bytes:
+        """Copy the decoded audio from chunk start_idx onward into a single bytes object."""
+        with memoryview(self._decoded) as view:
+            return view[self._offsets[start_idx]:self._size].tobytes()
         
     def should_do_incremental_transcription(self) -> bool:
         """
         Determine if we should do incremental transcription.
         Only transcribe if we have accumulated enough NEW chunks.
         """
-        current_size = len(self.chunks)
+        current_size = len(self)
         if current_size >= self.last_incremental_size + self.incremental_size_threshold:
             return True
         return False
         
-    def get_incremental_audio_data(self) -> Optional[str]:
+    def get_incremental_audio_bytes(self) -> Optional[bytes]:
         """
         Get combined audio data for incremental transcription.
         Returns only NEW chunks since the last incremental transcription.
         """
-        if not self.chunks:
+        if not self._offsets:
             return None
             
         try:
             # Only get chunks since the last incremental transcription
-            new_chunks = list(self.chunks)[self.last_incremental_size:]
+            new_chunks_count = len(self) - self.last_incremental_size
             
-            if not new_chunks:
+            if new_chunks_count <= 0:
                 return None
                 
-            logger.debug(f"Processing {len(new_chunks)} new chunks for incremental transcription")
+            logger.debug("Processing {} new chunks for incremental transcription", new_chunks_count)
             
-            # Combine only the new chunks
-            combined_data = b""
-            for chunk in new_chunks:
-                chunk_bytes = base64.b64decode(chunk)
-                combined_data += chunk_bytes
-            
-            # Return as base64 for transcription
-            return base64.b64encode(combined_data).decode('utf-8')
+            # Combine only the new chunks for transcription
+            return self._combine_chunks(self.last_incremental_size)
         except Exception as e:
-            logger.error(f"Error combining new chunks for incremental transcription: {e}")
+            logger.error("Error combining new chunks for incremental transcription: {}", e)
             return None
             
-    def get_overlapping_audio_data(self, overlap_chunks: int = 2) -> Optional[str]:
+    def get_overlapping_audio_bytes(self, overlap_chunks: int = 2) -> Optional[bytes]:
         """
         Get audio data with some overlap from previous transcription.
         This helps ensure we don't miss words at chunk boundaries.
         """
-        if not self.chunks:
+        if not self._offsets:
             return None
             
         try:
             # Include some overlap from previous transcription to avoid missing words
             start_idx = max(0, self.last_incremental_size - overlap_chunks)
-            chunks_to_process = list(self.chunks)[start_idx:]
             
-            if not chunks_to_process:
+            if start_idx >= len(self):
                 return None
                 
-            logger.debug(f"Processing {len(chunks_to_process)} chunks with overlap for incremental transcription")
-            
-            # Combine chunks with overlap
-            combined_data = b""
-            for chunk in chunks_to_process:
-                chunk_bytes = base64.b64decode(chunk)
-                combined_data += chunk_bytes
+            logger.debug("Processing {} chunks with overlap for incremental transcription", len(self) - start_idx)
             
-            # Return as base64 for transcription
-            return base64.b64encode(combined_data).decode('utf-8')
+            # Combine chunks with overlap for transcription
+            return self._combine_chunks(start_idx)
         except Exception as e:
-            logger.error(f"Error combining overlapping chunks for incremental transcription: {e}")
+            logger.error("Error combining overlapping chunks for incremental transcription: {}", e)
             return None
             
     def mark_incremental_transcription_done(self):
         """Mark that incremental transcription was done at current size."""
-        self.last_incremental_size = len(self.chunks)
+        self.last_incremental_size = len(self)
         
     def should_do_final_transcription(self) -> bool:
         """
         Determine if we should do final transcription.
         This happens when speech ends or after a timeout.
         """
-        if not self.is_speaking and self.chunks:
+        if not self.is_speaking and self._offsets:
             return True
             
         # Also check for timeout
         if (self.last_chunk_time and 
             time.time() - self.last_chunk_time >= self.final_timeout and 
-            len(self.chunks) > self.last_incremental_size):
+            len(self) > self.last_incremental_size):
             return True
             
         return False
         
-    def get_final_audio_data(self) -> Optional[str]:
+    def get_final_audio_bytes(self) -> Optional[bytes]:
         """Get all audio data for final transcription."""
-        if not self.chunks:
+        if not self._offsets:
             return None
             
         try:
-            # Combine all chunks into a single base64 string
-            combined_data = b""
-            for chunk in self.chunks:
-                chunk_bytes = base64.b64decode(chunk)
-                combined_data += chunk_bytes
-            
-            return base64.b64encode(combined_data).decode('utf-8')
+            # Combine all chunks into a single audio payload
+            return self._combine_chunks(0)
         except Exception as e:
-            logger.error(f"Error combining chunks for final transcription: {e}")
+            logger.error("Error combining chunks for final transcription: {}", e)
             return None
         
     def clear(self):
-        """Clear all chunks and reset state."""
-        self.chunks.clear()
+        """Clear all chunks and reset state, keeping the buffer's capacity for reuse."""
+        self._size = 0
+        self._offsets.clear()
         self.last_incremental_size = 0
         self.last_chunk_time = None
+        self.is_full = False
         
     def has_chunks(self) -> bool:
         """Check if there are any chunks in the buffer."""
-        return bool(self.chunks)
+        return bool(self._offsets)
+        
+    def release(self):
+        """Clear the buffer and return its storage to the pool; the buffer must not be used afterwards."""
+        self.clear()
+        _release_buffer(self._decoded)
+        self._decoded = bytearray()
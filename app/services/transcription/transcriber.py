@@ -3,22 +3,115 @@ Description:
 This module provides functionality to transcribe audio data encoded in base64 format using the Faster Whisper model
 Dependencies:
 - faster-whisper: For audio transcription.
-- tempfile: For creating temporary files.
-- base64: For decoding base64 audio data.
+- ctranslate2: For detecting CUDA devices and supported compute types.
+- io: For passing decoded audio to the model in memory.
+- asyncio / concurrent.futures: For running transcription off the event loop.
+- pybase64: For SIMD-accelerated decoding of base64 audio data.
+- numpy: For the silent buffer used to warm up the model.
 Authors: @kcaparas1630
          @William226
 """
-from faster_whisper import WhisperModel
-import tempfile
-import base64
-from loguru import logger
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.vad import get_vad_model
+import ctranslate2
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import io
+import numpy as np
 import os
+import pybase64
+from typing import Iterator
+from loguru import logger
+
+# Any faster-whisper checkpoint name or CTranslate2 model path, e.g. "distil-small.en"
+# or "distil-medium.en" for a shallower decoder where the host can download it
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base.en")
 
 _model = None
+_batched_model = None
+
+# One CTranslate2 worker per process; its intra-op threads are capped so several
+# uvicorn workers on one host don't oversubscribe the cores
+_NUM_WORKERS = 1
+_MAX_CPU_THREADS = 4
+
+# Transcriptions run here instead of on the event loop; one thread per model
+# worker, since extra threads would only queue inside CTranslate2
+_transcription_executor = ThreadPoolExecutor(max_workers=_NUM_WORKERS, thread_name_prefix="transcriber")
+
+# Silero VAD settings: split on half-second pauses and keep less padding than the
+# defaults (2s / 400ms), so long silences inside an answer never reach the encoder
+VAD_PARAMETERS = {
+    "min_silence_duration_ms": 500,
+    "speech_pad_ms": 200,
+}
+
+# Decoding options shared by every transcription: greedy sampling, no conditioning
+# on earlier segments and no word-level alignment pass
+TRANSCRIBE_OPTIONS = {
+    "best_of": 1,
+    "temperature": 0,
+    "vad_filter": True,
+    "word_timestamps": False,
+    "condition_on_previous_text": False,
+}
+
+# Incremental snippets are re-transcribed as the answer grows, so they use greedy
+# search; complete recordings keep the wider beam for accuracy
+INCREMENTAL_BEAM_SIZE = 1
+FINAL_BEAM_SIZE = 7
+
+def select_device():
+    """
+    Pick the device and compute type for the WhisperModel.
+    
+    Uses the GPU with float16 when CUDA is available (int8_float16 on GPUs without
+    efficient float16 support) and falls back to int8 on the CPU.
+    
+    Returns:
+        tuple: The (device, compute_type) pair to load the model with.
+    """
+    if ctranslate2.get_cuda_device_count() > 0:
+        supported = ctranslate2.get_supported_compute_types("cuda")
+        compute_type = "float16" if "float16" in supported else "int8_float16"
+        return "cuda", compute_type
+    return "cpu", "int8"
+
+def cpu_thread_count() -> int:
+    """
+    Number of CPU threads for the model, based on the available cores.
+    
+    Returns:
+        int: Threads per worker, between 1 and _MAX_CPU_THREADS.
+    """
+    cores = os.cpu_count() or 1
+    return max(1, min(_MAX_CPU_THREADS, cores // _NUM_WORKERS))
+
+def warm_up_transcriber():
+    """
+    Load the models and run one transcription of a short silent buffer.
+    
+    Called once at application startup so model loading, CTranslate2 kernel
+    selection, weight paging and tokenizer setup don't land on the first user's
+    utterance. Failures are logged, not raised, since the model still loads lazily.
+    """
+    try:
+        model = TranscriberService().model
+        get_vad_model()
+        # 0.1s of 16kHz silence; VAD is off so the encoder and decoder actually run,
+        # and the lazy segment generator is drained to force decoding
+        segments, _ = model.transcribe(np.zeros(1600, dtype=np.float32), beam_size=1, vad_filter=False)
+        for _ in segments:
+            pass
+        logger.info("Transcriber warm-up completed")
+    except Exception as e:
+        logger.warning(f"Transcriber warm-up failed: {e}")
 
 class TranscriberService:
     def __init__(self):
         self.model = self.get_model()
+        self.batched_model = self.get_batched_model()
     
     def get_model(self):
         """
@@ -30,47 +123,133 @@ class TranscriberService:
         """
         global _model
         if _model is None:
-            _model = WhisperModel("base.en", device="cpu", compute_type="int8", num_workers=1, cpu_threads=4)
+            device, compute_type = select_device()
+            logger.info(f"Loading WhisperModel {WHISPER_MODEL} on {device} with compute type {compute_type}")
+            _model = WhisperModel(
+                WHISPER_MODEL,
+                device=device,
+                compute_type=compute_type,
+                num_workers=_NUM_WORKERS,
+                cpu_threads=cpu_thread_count()
+            )
         return _model
     
-    def transcribe_base64_audio(self, base64_data: str) -> str:
+    def get_batched_model(self):
+        """
+        Initializes and returns the batched inference pipeline over the shared WhisperModel.
+        
+        The pipeline splits audio into VAD-detected speech chunks and decodes them
+        in batches, which is faster than sequential decoding for complete answers.
+        
+        Returns:
+            BatchedInferencePipeline: The batched pipeline wrapping the shared model.
+        """
+        global _batched_model
+        if _batched_model is None:
+            _batched_model = BatchedInferencePipeline(model=self.get_model())
+        return _batched_model
+    
+    async def atranscribe_base64_audio(self, base64_data: str, batched: bool = False) -> str:
+        """
+        Transcribes base64 encoded audio data on the transcription thread pool.
+        
+        Args:
+            base64_data (str): Base64 encoded audio data in WebM/Opus format
+            batched (bool): Decode speech chunks in batches. Defaults to False.
+            
+        Returns:
+            str: Transcribed text from the audio
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _transcription_executor,
+            functools.partial(self.transcribe_base64_audio, base64_data, batched=batched)
+        )
+    
+    async def atranscribe_audio_bytes(self, audio_bytes: bytes, batched: bool = False) -> str:
+        """
+        Transcribes raw audio bytes on the transcription thread pool.
+        
+        Args:
+            audio_bytes (bytes): Audio data in WebM/Opus format
+            batched (bool): Decode speech chunks in batches. Defaults to False.
+            
+        Returns:
+            str: Transcribed text from the audio
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _transcription_executor,
+            functools.partial(self.transcribe_audio_bytes, audio_bytes, batched=batched)
+        )
+    
+    def transcribe_base64_audio(self, base64_data: str, batched: bool = False) -> str:
         """
         Transcribes base64 encoded audio data (WebM/Opus format) to text.
         
         Args:
             base64_data (str): Base64 encoded audio data in WebM/Opus format
+            batched (bool): Decode speech chunks in batches with the wider final beam;
+                use for complete recordings rather than short incremental snippets.
+                Defaults to False.
             
         Returns:
             str: Transcribed text from the audio
         """
         try:
-            audio_bytes = base64.b64decode(base64_data)
+            audio_bytes = pybase64.b64decode(base64_data, validate=False)
+        except Exception as e:
+            logger.error(f"Error decoding base64 audio: {str(e)}")
+            raise
+        return self.transcribe_audio_bytes(audio_bytes, batched=batched)
+    
+    def transcribe_audio_bytes(self, audio_bytes: bytes, batched: bool = False) -> str:
+        """
+        Transcribes raw audio bytes (WebM/Opus format) to text.
+        
+        Args:
+            audio_bytes (bytes): Audio data in WebM/Opus format
+            batched (bool): Decode speech chunks in batches with the wider final beam;
+                use for complete recordings rather than short incremental snippets.
+                Defaults to False.
             
-            # Use .webm extension for WebM/Opus format
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as temp_audio:
-                temp_audio.write(audio_bytes)
-                temp_path = temp_audio.name
+        Returns:
+            str: Transcribed text from the audio
+        """
+        return " ".join(self.transcribe_audio_bytes_stream(audio_bytes, batched=batched))
+    
+    def transcribe_audio_bytes_stream(self, audio_bytes: bytes, batched: bool = False) -> Iterator[str]:
+        """
+        Transcribes raw audio bytes (WebM/Opus format), yielding each segment's text
+        as soon as the model decodes it.
+        
+        Args:
+            audio_bytes (bytes): Audio data in WebM/Opus format
+            batched (bool): Decode speech chunks in batches with the wider final beam;
+                use for complete recordings rather than short incremental snippets.
+                Defaults to False.
             
+        Yields:
+            str: Text of the next transcribed segment
+        """
+        try:
+            # Decode the WebM/Opus audio in memory instead of round-tripping through a temp file
+            audio_file = io.BytesIO(audio_bytes)
+            audio_file.name = "audio.webm"
             
-            segments, _ = self.model.transcribe(
-                temp_path,
-                beam_size=7,
-                best_of=1,
-                temperature=0,
-                vad_filter=True,
-                word_timestamps=False,
-                condition_on_previous_text=False
+            model = self.batched_model if batched else self.model
+            segments, _ = model.transcribe(
+                audio_file,
+                beam_size=FINAL_BEAM_SIZE if batched else INCREMENTAL_BEAM_SIZE,
+                # Copy per call: the batched pipeline mutates the dict it is given
+                vad_parameters=dict(VAD_PARAMETERS),
+                **TRANSCRIBE_OPTIONS
             )
             
-            transcribe_text = " ".join([seg.text for seg in segments])
-            return transcribe_text
+            # Segments are decoded lazily, so each one is handed on as it is produced
+            for seg in segments:
+                yield seg.text
             
         except Exception as e:
             logger.error(f"Error transcribing audio: {str(e)}")
             raise
-        finally:
-            try:
-                if 'temp_path' in locals():
-                    os.unlink(temp_path)
-            except OSError as e:
-                logger.warning(f"Error removing temporary file {temp_path}: {str(e)}")
@@ -0,0 +1,85 @@
+"""
+Test Audio Buffer Module
+
+This module tests the IncrementalAudioBuffer used by the websocket handler,
+covering the size cap and the pooling of its decoded-audio storage.
+
+Dependencies:
+- pytest: For testing framework
+- pybase64: For encoding test audio chunks
+- app.services.transcription.audio_buffer: The module being tested
+
+Author: @kcaparas1630
+"""
+
+import pybase64
+from app.services.transcription import audio_buffer
+from app.services.transcription.audio_buffer import IncrementalAudioBuffer
+
+def encode_chunk(data: bytes) -> str:
+    """Base64-encode raw bytes the way the client sends audio chunks."""
+    return pybase64.b64encode(data).decode()
+
+class TestBufferCap:
+    """Test the max_buffer_bytes cap."""
+
+    def test_final_chunk_after_full_still_ends_speech(self):
+        """Test that an isSpeaking=False chunk dropped by a full buffer still triggers final transcription."""
+        buffer = IncrementalAudioBuffer(max_buffer_bytes=8)
+        assert buffer.add_chunk(encode_chunk(b"abcd")) is True
+        assert buffer.add_chunk(encode_chunk(b"efgh")) is True
+        buffer.mark_incremental_transcription_done()
+
+        assert buffer.add_chunk(encode_chunk(b"ijkl"), is_speaking=False) is False
+
+        assert buffer.is_full is True
+        assert buffer.should_do_final_transcription() is True
+        assert buffer.get_final_audio_bytes() == b"abcdefgh"
+
+    def test_clear_resets_full_state(self):
+        """Test that clearing a full buffer lets it accept audio again."""
+        buffer = IncrementalAudioBuffer(max_buffer_bytes=4)
+        buffer.add_chunk(encode_chunk(b"abcd"))
+        buffer.add_chunk(encode_chunk(b"efgh"))
+
+        buffer.clear()
+
+        assert buffer.is_full is False
+        assert buffer.add_chunk(encode_chunk(b"ijkl")) is True
+        assert buffer.get_final_audio_bytes() == b"ijkl"
+
+class TestBufferPool:
+    """Test reuse of decoded-audio storage across sessions."""
+
+    def setup_method(self):
+        audio_buffer._BUFFER_POOL.clear()
+
+    def test_released_buffer_is_reused(self):
+        """Test that a released buffer is handed to the next session, emptied."""
+        first = IncrementalAudioBuffer()
+        first.add_chunk(encode_chunk(b"abcd"))
+        storage = first._decoded
+        first.release()
+
+        second = IncrementalAudioBuffer()
+
+        assert second._decoded is storage
+        assert second.get_final_audio_bytes() is None
+        assert second.add_chunk(encode_chunk(b"efgh")) is True
+        assert second.get_final_audio_bytes() == b"efgh"
+
+    def test_oversized_buffer_is_not_pooled(self):
+        """Test that a buffer grown past the capacity threshold is dropped on release."""
+        buffer = IncrementalAudioBuffer()
+        buffer.add_chunk(encode_chunk(b"x" * (audio_buffer._BUFFER_POOL_MAX_CAPACITY + 1)))
+        buffer.release()
+
+        assert audio_buffer._BUFFER_POOL == []
+
+    def test_pool_size_is_capped(self):
+        """Test that the pool never holds more than _BUFFER_POOL_MAX_SIZE buffers."""
+        buffers = [IncrementalAudioBuffer() for _ in range(audio_buffer._BUFFER_POOL_MAX_SIZE + 2)]
+        for buffer in buffers:
+            buffer.release()
+
+        assert len(audio_buffer._BUFFER_POOL) == audio_buffer._BUFFER_POOL_MAX_SIZE
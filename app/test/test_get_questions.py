@@ -0,0 +1,45 @@
+"""
+Test Get Questions Module
+
+This module tests the in-process question cache of get_questions, with the
+blocking MongoDB query patched out.
+
+Dependencies:
+- pytest: For testing framework
+- asyncio: For running concurrent lookups
+- unittest.mock: For patching the MongoDB query
+- app.services.main_conversation.tools.question_utils.get_questions: The module being tested
+
+Author: @kcaparas1630
+"""
+
+import asyncio
+from unittest.mock import patch
+from app.services.main_conversation.tools.question_utils import get_questions as questions_module
+
+QUESTION_DATA = [{"id": "1", "text": "Tell me about yourself."}]
+
+class TestQuestionsCache:
+    """Test caching and per-criteria locking in get_questions."""
+
+    def setup_method(self):
+        questions_module.clear_questions_cache()
+
+    async def test_concurrent_misses_share_one_query(self):
+        """Test that concurrent misses run one query and leave no lock behind."""
+        with patch.object(questions_module, "_find_question_data", return_value=QUESTION_DATA) as find:
+            results = await asyncio.gather(*[
+                questions_module.get_questions("Software Engineer", "Mid", "Behavioral") for _ in range(5)
+            ])
+
+        find.assert_called_once()
+        assert all(result["question_data"] == QUESTION_DATA for result in results)
+        assert questions_module._questions_locks == {}
+
+    async def test_locks_do_not_accumulate_across_criteria(self):
+        """Test that misses for many distinct criteria do not grow the lock table."""
+        with patch.object(questions_module, "_find_question_data", return_value=[]):
+            for level in range(20):
+                await questions_module.get_questions("Software Engineer", str(level), "Technical")
+
+        assert questions_module._questions_locks == {}
@@ -13,48 +13,43 @@ Author: @kcaparas1630
 """
 
 import pytest
+import re
 from app.core.secure_prompt_manager import SecurePromptManager, sanitize_text, PromptTemplate
 from app.schemas.session_evaluation_schemas.interview_analysis_request import InterviewAnalysisRequest
 from app.schemas.session_evaluation_schemas.session_state import SessionMetadata
 from app.schemas.main.interview_session import InterviewSession
 
+# Raw injected tags that must never survive sanitization, matched in one scan
+INJECTED_TAGS_RE = re.compile(r"<(?:injection|script)>")
+
+def missing_fragments(prompt: str, required: set) -> set:
+    """Return the required fragments that do not appear in the prompt."""
+    return {fragment for fragment in required if fragment not in prompt}
+
 class TestSanitizeText:
     """Test the sanitize_text function for various injection attempts."""
     
-    def test_sanitize_normal_text(self):
-        """Test that normal text is sanitized correctly."""
-        text = "Hello, this is a normal response."
-        result = sanitize_text(text)
-        assert result == "Hello, this is a normal response."
-    
-    def test_sanitize_html_injection(self):
-        """Test that HTML injection is prevented."""
-        text = "<script>alert('xss')</script>Hello"
-        result = sanitize_text(text)
-        assert "<script>" not in result
-        assert "&lt;script&gt;" in result
-    
-    def test_sanitize_null_bytes(self):
-        """Test that null bytes are removed."""
-        text = "Hello\x00World"
-        result = sanitize_text(text)
-        assert "\x00" not in result
-        assert "HelloWorld" in result
-    
-    def test_sanitize_control_characters(self):
-        """Test that control characters are removed."""
-        text = "Hello\x01\x02\x03World"
-        result = sanitize_text(text)
-        assert "\x01" not in result
-        assert "\x02" not in result
-        assert "\x03" not in result
-        assert "HelloWorld" in result
-    
-    def test_sanitize_length_limit(self):
-        """Test that text is truncated to prevent DoS."""
-        long_text = "A" * 2000
-        result = sanitize_text(long_text)
-        assert len(result) <= 1000
+    @pytest.mark.parametrize("text, check", [
+        pytest.param("Hello, this is a normal response.",
+                     lambda r: r == "Hello, this is a normal response.", id="normal_text"),
+        pytest.param("<script>alert('xss')</script>Hello",
+                     lambda r: "<script>" not in r and "&lt;script&gt;" in r, id="html_injection"),
+        pytest.param("Hello\x00World",
+                     lambda r: "\x00" not in r and "HelloWorld" in r, id="null_bytes"),
+        pytest.param("Hello\x01\x02\x03World",
+                     lambda r: not {"\x01", "\x02", "\x03"} & set(r) and "HelloWorld" in r, id="control_characters"),
+        pytest.param("Hello\u202eWorld\u200b\u2066",
+                     lambda r: r == "HelloWorld", id="bidi_and_zero_width"),
+        pytest.param("\u200b  Hello  \u200b",
+                     lambda r: r == "Hello", id="whitespace_inside_zero_width"),
+        pytest.param("\x01 Hi",
+                     lambda r: r == "Hi", id="whitespace_after_control_character"),
+        pytest.param("A" * 2000,
+                     lambda r: len(r) <= 1000, id="length_limit"),
+    ])
+    def test_sanitize(self, text, check):
+        """Test that sanitize_text neutralizes injection attempts, control characters and oversized input."""
+        assert check(sanitize_text(text))
     
     def test_sanitize_none_input(self):
         """Test that None input raises ValueError."""
@@ -175,13 +170,16 @@ class TestSecurePromptManager:
         prompt = self.manager.get_system_prompt(malicious_session)
         
         # Check that the injection attempt is sanitized
-        assert "<injection>" not in prompt
-        assert "&lt;injection&gt;" in prompt
-        assert "Malicious content" in prompt  # Content should be preserved but sanitized
+        assert INJECTED_TAGS_RE.search(prompt) is None
         
-        # Check that the prompt structure is intact (system prompt doesn't use core_identity tags)
-        assert "expert HR professional" in prompt
-        assert "CRITICAL RULES FOR QUESTIONS" in prompt
+        # Content should be preserved but sanitized, and the prompt structure intact
+        # (system prompt doesn't use core_identity tags)
+        assert not missing_fragments(prompt, {
+            "&lt;injection&gt;",
+            "Malicious content",
+            "expert HR professional",
+            "CRITICAL RULES FOR QUESTIONS"
+        })
     
     def test_response_analysis_injection_prevention(self):
         """Test that response analysis injection attempts are prevented."""
@@ -201,41 +199,33 @@ class TestSecurePromptManager:
         prompt = self.manager.get_response_analysis_prompt(malicious_request)
         
         # Check that injection attempts are sanitized
-        assert "<injection>" not in prompt
-        assert "&lt;injection&gt;" in prompt
-        assert "<script>" not in prompt
-        assert "&lt;script&gt;" in prompt
+        assert INJECTED_TAGS_RE.search(prompt) is None
         
-        # Check that the prompt structure is intact
-        assert "<output_format>" in prompt
-        assert "<core_identity>" in prompt
-        assert "Return ONLY valid JSON" in prompt
+        # Check that the escaped content is present and the prompt structure is intact
+        assert not missing_fragments(prompt, {
+            "&lt;injection&gt;",
+            "&lt;script&gt;",
+            "<output_format>",
+            "<core_identity>",
+            "Return ONLY valid JSON"
+        })
 
 class TestSecurityFeatures:
     """Test specific security features and edge cases."""
     
-    def test_unicode_normalization(self):
-        """Test that unicode characters are properly normalized."""
-        text = "Hello\u2028World\u2029"  # Unicode line/paragraph separators
-        result = sanitize_text(text)
-        # Note: The current sanitize_text function doesn't remove \u2028 and \u2029
-        # This is acceptable as they are not control characters in the current regex
-        assert "Hello" in result
-        assert "World" in result
-    
-    def test_whitespace_handling(self):
-        """Test that whitespace is properly handled."""
-        text = "  Hello  World  "
-        result = sanitize_text(text)
-        assert result == "Hello  World"  # Leading/trailing stripped, internal preserved
-    
-    def test_special_characters(self):
-        """Test that special characters are properly escaped."""
-        text = "Hello & World < 5 > 3"
-        result = sanitize_text(text)
-        assert "&amp;" in result
-        assert "&lt;" in result
-        assert "&gt;" in result
+    @pytest.mark.parametrize("text, check", [
+        # Note: sanitize_text doesn't remove \u2028 and \u2029, which is acceptable
+        # as they are not in the stripped control character set
+        pytest.param("Hello\u2028World\u2029",
+                     lambda r: "Hello" in r and "World" in r, id="unicode_normalization"),
+        pytest.param("  Hello  World  ",
+                     lambda r: r == "Hello  World", id="whitespace_handling"),  # Leading/trailing stripped, internal preserved
+        pytest.param("Hello & World < 5 > 3",
+                     lambda r: "&amp;" in r and "&lt;" in r and "&gt;" in r, id="special_characters"),
+    ])
+    def test_sanitize_edge_cases(self, text, check):
+        """Test unicode, whitespace and special character handling."""
+        assert check(sanitize_text(text))
     
     def test_template_placeholder_validation(self):
         """Test that template placeholders are properly validated."""